@@ -1,27 +1,27 @@
+import asyncio
 import json
 from tqdm import tqdm
 import uuid
-from src.ai.graphs import create_orchestrator_graph
+from src.ai.graphs import get_orchestrator_graph, ORCHESTRATOR_DURABILITY
 from src.ai.graph_states.orchestrator_state import OrchestratorState
-import time
 import os
 
 # Helper functions
-def run_orchestrator(graph, input_dict: dict, config: dict):
-    final_state = None
-    for stream_mode, payload in graph.stream(
+async def arun_orchestrator(graph, input_dict: dict, config: dict):
+    # Only custom progress messages are needed while running; "values" mode would
+    # emit the full state after every step just to keep the last one. The
+    # checkpoint is written once, when the run exits.
+    async for payload in graph.astream(
         input_dict,
         config=config,
-        stream_mode=["values", "custom"],
+        stream_mode="custom",
+        durability=ORCHESTRATOR_DURABILITY,
     ):
-        if stream_mode == "custom":
-            print(payload.get("message"))
-        elif stream_mode == "values":
-            final_state = payload
-        else:
-            pass
+        print(payload.get("message"))
     
-    return final_state
+    # Read the final state once from the checkpoint
+    snapshot = await graph.aget_state(config)
+    return snapshot.values or None
 
 def print_app_location(final_state: dict):
     if final_state and final_state.get("root_dir"):
@@ -63,8 +63,9 @@ def save_result(final_state: dict):
 
 
 
-if __name__ == "__main__":
-
+async def main():
+    # The whole CLI session runs in one event loop: the cached graph's LLM
+    # clients keep pooled connections bound to the loop that opened them.
     raw_user_input = input("Enter your prompt: ")
 
     # Generate UUID for thread_id if app_id not provided
@@ -81,22 +82,22 @@ if __name__ == "__main__":
         }
     }
 
-    graph = create_orchestrator_graph()
+    graph = get_orchestrator_graph()
 
-    final_state = run_orchestrator(graph, initial_state, config)
+    final_state = await arun_orchestrator(graph, initial_state, config)
 
     save_result(final_state)
     
     print_app_location(final_state)
 
     while True:
-        time.sleep(30)
+        await asyncio.sleep(30)
         user_feedback = input("Enter your feedback (or 'q' to quit): ")
         if user_feedback == 'q':
             break
 
         if user_feedback:
-            final_state = run_orchestrator(
+            final_state = await arun_orchestrator(
                 graph,
                 {
                     "user_feedback": user_feedback,
@@ -104,4 +105,7 @@ if __name__ == "__main__":
                 config
             )
             save_result(final_state)
-    
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -1,6 +1,6 @@
 """Architect Agent - translates intent into stable architecture plan."""
 
-from typing import Dict, Any, Optional, List, Literal
+from typing import Dict, Any, Optional, List, Literal, Tuple
 import json
 from dotenv import load_dotenv
 import os
@@ -11,19 +11,44 @@ from langchain_ollama import ChatOllama
 from langgraph.config import get_stream_writer
 
 from ..models.architect_models import ArchitectResponse
-from ..prompts.architect_prompts import (
-    ARCHITECT_INITIAL_PROMPT,
-    ARCHITECT_ITERATIVE_PROMPT,
-)
+from ..prompts.architect_prompts import get_architect_prompts
 from ..graph_states.orchestrator_state import OrchestratorState
 
 from ..utils.llm_provider import init_llm
+from ..utils.file_utils import save_spec_json
+from ..utils.json_utils import content_hash
+from ..utils.cache_utils import lru_cache_by
 
 load_dotenv()
 
 OLLAMA_BASE_URL = os.getenv("OLLAMA_BASE_URL")
 
 
+def _check_generators(response: ArchitectResponse, agent_registry: List[Dict[str, Any]]) -> None:
+    """Validate that all generators exist in the registry."""
+    registry_agent_ids = {agent.get("agent_id") for agent in agent_registry}
+    for layer in response.execution_layers:
+        if layer.generator not in registry_agent_ids:
+            raise ValueError(
+                f"Layer '{layer.id}' references generator '{layer.generator}' "
+                f"which is not in the agent registry. "
+                f"Available agents: {registry_agent_ids}"
+            )
+
+
+def _iterative_cache_key(
+    intent: Dict[str, Any],
+    agent_registry: List[Dict[str, Any]],
+    existing_architecture: Optional[Dict[str, Any]],
+) -> Tuple[bytes, bytes, bytes]:
+    """Key ITERATIVE planning calls by the content of their inputs."""
+    return (
+        content_hash(intent),
+        content_hash(existing_architecture),
+        content_hash(agent_registry),
+    )
+
+
 class ArchitectAgent:
     """Agent responsible for creating and evolving architecture plans."""
     
@@ -40,14 +65,19 @@ class ArchitectAgent:
             model: The model to use
             additional_kwargs: Additional kwargs to pass to the LLM
         """
-        self.llm = init_llm(provider, model, additional_kwargs)
+        # The system prompt is fully static (the registry follows it in its own
+        # message), so a stable cache key lets repeat calls reuse the prefix
+        self.llm = init_llm(provider, model, additional_kwargs, prompt_cache_key="app-builder-architect")
         
         # Create LLM with structured output for both modes
         self.llm = self.llm.with_structured_output(ArchitectResponse, method="function_calling")
         
-        # Create chains for both modes
-        self.initial_chain = ARCHITECT_INITIAL_PROMPT | self.llm
-        self.iterative_chain = ARCHITECT_ITERATIVE_PROMPT | self.llm
+        # Memoize ITERATIVE planning per agent, so agents configured for different
+        # providers or models never share responses. A MODIFY run whose intent,
+        # existing architecture and registry all match an earlier call of this
+        # agent (retries, repeated feedback rounds) returns the earlier validated
+        # response and never reaches the LLM again.
+        self._plan_iterative = lru_cache_by(_iterative_cache_key, maxsize=16)(self._plan_iterative)
     
     def execute(
         self,
@@ -67,35 +97,32 @@ class ArchitectAgent:
         Returns:
             ArchitectResponse from the LLM chain
         """
-        # Format agent registry for prompt
-        agent_registry_str = json.dumps(agent_registry, indent=2)
-        intent_str = json.dumps(intent, indent=2)
-        
-        if mode == "CREATE":
-            # INITIAL mode: create new architecture
-            response = self.initial_chain.invoke({
-                "intent": intent_str,
-                "agent_registry": agent_registry_str,
-            })
-        else:
-            # ITERATIVE mode: evolve existing architecture
-            existing_architecture_str = json.dumps(existing_architecture, indent=2)
-            response = self.iterative_chain.invoke({
-                "intent": intent_str,
-                "existing_architecture": existing_architecture_str,
-                "agent_registry": agent_registry_str,
-            })
+        if mode != "CREATE":
+            return self._plan_iterative(intent, agent_registry, existing_architecture)
         
-        # Validate that all generators exist in the registry
-        registry_agent_ids = {agent.get("agent_id") for agent in agent_registry}
-        for layer in response.execution_layers:
-            if layer.generator not in registry_agent_ids:
-                raise ValueError(
-                    f"Layer '{layer.id}' references generator '{layer.generator}' "
-                    f"which is not in the agent registry. "
-                    f"Available agents: {registry_agent_ids}"
-                )
+        # Prompts with the agent registry already filled in (cached per registry)
+        initial_prompt, _ = get_architect_prompts(agent_registry)
         
+        # INITIAL mode: create new architecture
+        response = (initial_prompt | self.llm).invoke({
+            "intent": json.dumps(intent, indent=2),
+        })
+        _check_generators(response, agent_registry)
+        return response
+    
+    def _plan_iterative(
+        self,
+        intent: Dict[str, Any],
+        agent_registry: List[Dict[str, Any]],
+        existing_architecture: Optional[Dict[str, Any]],
+    ) -> ArchitectResponse:
+        """ITERATIVE mode: evolve the existing architecture."""
+        _, iterative_prompt = get_architect_prompts(agent_registry)
+        response = (iterative_prompt | self.llm).invoke({
+            "intent": json.dumps(intent, indent=2),
+            "existing_architecture": json.dumps(existing_architecture, indent=2),
+        })
+        _check_generators(response, agent_registry)
         return response
     
     def __call__(self, state: OrchestratorState, config: Optional[RunnableConfig] = None) -> OrchestratorState:
@@ -142,6 +169,10 @@ class ArchitectAgent:
         if not isinstance(response, ArchitectResponse):
             raise ValueError(f"Unexpected response type: {type(response)}")
         
+        # Save architecture to <root_dir>/spec/architecture.json
+        architecture = response.model_dump()
+        save_spec_json(state.get("root_dir"), "architecture.json", architecture, default=str)
+        
         # Send custom message after execution
         if writer:
             writer({
@@ -150,8 +181,8 @@ class ArchitectAgent:
                 "status": "completed",
             })
         
-        # Update state with results (persistence handled by orchestrator)
+        # Update state with results. Only the changed key is returned; the graph
+        # merges it into the existing state.
         return {
-            **state,
-            "architecture": response.model_dump(),
+            "architecture": architecture,
         }
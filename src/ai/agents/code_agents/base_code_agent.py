@@ -0,0 +1,233 @@
+"""Base Code Agent - shared node plumbing for the spec-driven code generation agents."""
+
+from typing import Dict, Any, Optional, Literal, Type
+import json
+from langchain_core.runnables import RunnableConfig
+from langgraph.config import get_stream_writer
+import os
+
+from ...models.code_agents.code_agent_models import ManifestFile, Manifest
+from ...utils.llm_provider import init_llm
+
+
+class BaseCodeAgent:
+    """Generate one execution layer's files from its spec.
+
+    Subclasses only declare what differs between layers: the response and spec
+    models, the prompt, the state key the spec is known by and the progress
+    message text. Resolving inputs from state, invoking the LLM, writing files
+    and building the layer manifest are shared, for both the sync (`__call__`)
+    and async (`ainvoke`) LangGraph node interfaces.
+    """
+
+    # Structured output model returned by the LLM
+    response_model: Type[Any]
+    # Spec model produced by the spec planner for this layer
+    spec_model: Type[Any]
+    # Prompt variable (and error label) the serialized spec is passed as
+    spec_key: str
+    prompt: Any
+    # Node name reported in custom stream messages
+    node: str
+    # Progress messages; formatted with the current layer id
+    start_message: str
+    complete_message: str
+    # Whether the prompt takes the manifests of previously generated layers
+    uses_manifests: bool = True
+
+    def __init__(
+        self,
+        provider: Literal["openai", "ollama"],
+        model: str,
+        additional_kwargs: dict,
+    ):
+        """Initialize the agent.
+
+        Args:
+            provider: The LLM provider to use
+            model: The model name to use
+            additional_kwargs: Additional kwargs to pass to the LLM
+        """
+        # Every code agent's system prompt is static, so a stable per-agent cache
+        # key lets repeat calls reuse the cached prefix
+        self.llm = init_llm(provider, model, additional_kwargs, prompt_cache_key=f"app-builder-{self.node}")
+        # Use structured output for code generation response
+        llm_with_structure = self.llm.with_structured_output(
+            self.response_model,
+            method="function_calling"
+        )
+        self.chain = self.prompt | llm_with_structure
+
+    def _prompt_inputs(
+        self,
+        entities: Dict[str, Any],
+        spec: Any,
+        manifests: Optional[list] = None,
+    ) -> Dict[str, str]:
+        """Format the prompt inputs for the LLM chain."""
+        prompt_inputs = {
+            self.spec_key: json.dumps(spec.model_dump(), indent=2),
+            "entities_info": json.dumps(entities, indent=2),
+        }
+        if self.uses_manifests:
+            prompt_inputs["manifests_info"] = json.dumps(manifests or [], indent=2)
+        return prompt_inputs
+
+    def execute(
+        self,
+        entities: Dict[str, Any],
+        spec: Any,
+        manifests: Optional[list] = None,
+    ) -> Any:
+        """Execute the code generation logic.
+
+        Args:
+            entities: Entity definitions from intent.primary_entities
+            spec: This layer's specification from the spec planner
+            manifests: List of manifests from previous agents
+
+        Returns:
+            The agent's response with files, warnings, and metadata
+        """
+        # Invoke the LLM chain
+        return self.chain.invoke(self._prompt_inputs(entities, spec, manifests))
+
+    async def aexecute(
+        self,
+        entities: Dict[str, Any],
+        spec: Any,
+        manifests: Optional[list] = None,
+    ) -> Any:
+        """Async variant of `execute`."""
+        return await self.chain.ainvoke(self._prompt_inputs(entities, spec, manifests))
+
+    def __call__(
+        self,
+        state: Dict[str, Any],
+        config: Optional[RunnableConfig] = None
+    ) -> Dict[str, Any]:
+        """LangGraph node interface.
+
+        Args:
+            state: Current workflow state
+            config: Optional runtime configuration
+
+        Returns:
+            Updated state with code generation results
+        """
+        inputs = self._prepare(state)
+        result = self.execute(**inputs)
+        return self._save(state, inputs, result)
+
+    async def ainvoke(
+        self,
+        state: Dict[str, Any],
+        config: Optional[RunnableConfig] = None
+    ) -> Dict[str, Any]:
+        """Async LangGraph node interface.
+
+        Same contract as `__call__`, but awaits the LLM so layers dispatched in
+        the same step overlap their network round trips.
+        """
+        inputs = self._prepare(state)
+        result = await self.aexecute(**inputs)
+        return self._save(state, inputs, result)
+
+    def _notify(self, message: str, status: str) -> None:
+        """Send a custom stream message for this node and echo it to stdout."""
+        # Get stream writer for custom streaming
+        writer = get_stream_writer()
+        if writer:
+            writer({
+                "message": message,
+                "node": self.node,
+                "status": status,
+            })
+        print(message)
+
+    def _prepare(self, state: Dict[str, Any]) -> Dict[str, Any]:
+        """Resolve agent inputs from state and announce the start of generation.
+
+        Returns:
+            Keyword arguments for `execute` / `aexecute`
+        """
+        # Extract inputs from state
+        entities = state.get("intent").get("primary_entities")
+        manifests = state.get("manifests", [])
+
+        # Layer assigned to this node by the scheduler's Send
+        current_layer_id, current_layer_path = state.get("current_layer")
+
+        layer_spec = None
+        for spec in state.get("specs"):
+            if spec.get("layer_id") == current_layer_id:
+                layer_spec = spec.get("spec")
+                break
+
+        if not layer_spec:
+            raise ValueError(f"{self.spec_key} is required in state")
+
+        # Convert spec dict to model if needed
+        if isinstance(layer_spec, dict):
+            layer_spec = self.spec_model(**layer_spec)
+
+        # Send custom message before execution
+        self._notify(self.start_message.format(layer_id=current_layer_id), "starting")
+
+        return {
+            "entities": entities,
+            "spec": layer_spec,
+            "manifests": manifests,
+        }
+
+    def _save(
+        self,
+        state: Dict[str, Any],
+        inputs: Dict[str, Any],
+        result: Any,
+    ) -> Dict[str, Any]:
+        """Write generated files to disk and build this layer's manifest."""
+        current_layer_id, current_layer_path = state.get("current_layer")
+
+        # Get root_dir from state
+        root_dir = state.get("root_dir")
+        if not root_dir:
+            raise ValueError("root_dir is required in state")
+
+        # If the layer path includes a filename (e.g., backend/main.py), use its directory
+        layer_dir = current_layer_path
+        if layer_dir.endswith(".py"):
+            layer_dir = os.path.dirname(layer_dir)
+
+        file_root_path = root_dir / layer_dir
+        file_root_path.mkdir(parents=True, exist_ok=True)
+
+        manifest_files = []
+        for file in result.files:
+            # Extract just the filename in case LLM returns a path
+            filename = os.path.basename(file.filename)
+            with open(file_root_path / filename, "w") as f:
+                f.write(file.code_content)
+
+            manifest_files.append(ManifestFile(
+                file_path=os.path.join(layer_dir, filename),
+                imports=file.imports,
+                exports=file.exports,
+                dependencies=file.dependencies,
+                summary=file.summary,
+            ))
+
+        manifest = Manifest(
+            layer_id=current_layer_id,
+            spec=inputs["spec"].model_dump(),
+            manifest_files=manifest_files,
+        )
+
+        # Send custom message after execution
+        self._notify(self.complete_message.format(layer_id=current_layer_id), "completed")
+
+        # Return only this layer's results; layers running in parallel merge via reducers
+        return {
+            "manifests": [manifest],
+            "completed_layers": [current_layer_id],
+        }
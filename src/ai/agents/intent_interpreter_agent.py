@@ -10,7 +10,7 @@ from langchain_openai import ChatOpenAI
 from langchain_ollama import ChatOllama
 from langgraph.config import get_stream_writer
 
-from ..models.intent_models import IntentInterpreterResponse
+from ..models.intent_models import IntentInterpreterResponse, INTENT_RESPONSE_VALIDATE, DEFAULT_ASSUMPTIONS
 from ..prompts.intent_interpreter_prompts import (
     INTENT_INTERPRETER_CREATE_PROMPT,
     INTENT_INTERPRETER_MODIFY_PROMPT,
@@ -18,6 +18,7 @@ from ..prompts.intent_interpreter_prompts import (
 from ..graph_states.orchestrator_state import OrchestratorState
 
 from ..utils.llm_provider import init_llm
+from ..utils.file_utils import save_spec_json
 
 load_dotenv()
 
@@ -90,7 +91,6 @@ class IntentInterpreterAgent:
         intent_dict = response_dict["intent"]
         
         # Ensure default assumptions are always included
-        DEFAULT_ASSUMPTIONS = ["Single-user application", "Local execution"]
         existing_assumptions = intent_dict.get("assumptions", [])
         
         # Merge defaults with existing assumptions, ensuring defaults are always present
@@ -101,7 +101,7 @@ class IntentInterpreterAgent:
         
         intent_dict["assumptions"] = merged_assumptions
         
-        return IntentInterpreterResponse(**response_dict)
+        return INTENT_RESPONSE_VALIDATE(response_dict)
     
     def __call__(self, state: OrchestratorState, config: Optional[RunnableConfig] = None) -> OrchestratorState:
         """LangGraph node interface.
@@ -142,6 +142,10 @@ class IntentInterpreterAgent:
         if not isinstance(response, IntentInterpreterResponse):
             raise ValueError(f"Unexpected response type: {type(response)}")
         
+        # Save intent to <root_dir>/spec/intent.json
+        intent = response.intent.model_dump()
+        save_spec_json(state.get("root_dir"), "intent.json", intent)
+        
         # Send custom message after execution
         if writer:
             writer({
@@ -150,9 +154,8 @@ class IntentInterpreterAgent:
                 "status": "completed",
             })
         
-        # Update state with results (persistence handled by orchestrator)
+        # Update state with results
         return {
-            **state,
-            "intent": response.intent.model_dump(),
+            "intent": intent,
             "change_summary": response.change_summary,
         }
\ No newline at end of file
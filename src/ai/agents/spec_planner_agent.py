@@ -1,12 +1,13 @@
 """Spec Planner Agent - converts intent + architecture into layer-specific execution specs."""
 
-from typing import Dict, Any, Optional, Literal
-import json
+from typing import Dict, Any, List, Optional, Literal, Tuple
+from types import MappingProxyType
+import asyncio
 from pathlib import Path
 from dotenv import load_dotenv
 import os
 
-from langchain_core.runnables import RunnableConfig
+from langchain_core.runnables import Runnable, RunnableConfig
 from langgraph.config import get_stream_writer
 from pydantic import BaseModel
 
@@ -19,19 +20,27 @@ from ..models.spec_planner_models import (
     FrontendUISpec,
 )
 from ..prompts.spec_planner_prompts import SPEC_PLANNER_PROMPT
-from ..utils.llm_provider import init_llm
+from ..utils.llm_provider import (
+    init_llm,
+    SPECULATIVE_DECODING_HINTS,
+)
+from ..utils.json_utils import dumps_compact, load_cached, clone
+from ..utils.file_utils import save_spec_json
 
 load_dotenv()
 
-# Map layer IDs to their response models
-LAYER_SPEC_MODELS = {
+# Partialize the prompt once at import time instead of on every chain build
+_SPEC_PLANNER_PROMPT = SPEC_PLANNER_PROMPT.partial()
+
+# Map layer IDs to their response models (read-only)
+LAYER_SPEC_MODELS = MappingProxyType({
     "backend_models": BackendModelsSpec,
     "database": DatabaseSpec,
     "backend_services": BackendServicesSpec,
     "backend_routes": BackendRoutesSpec,
     "backend_app": BackendAppBootstrapSpec,
     "frontend_ui": FrontendUISpec,
-}
+})
 
 
 class SpecPlannerAgent:
@@ -50,16 +59,35 @@ class SpecPlannerAgent:
             model: The model to use
             additional_kwargs: Additional kwargs to pass to the LLM
         """
-        self.llm = init_llm(provider, model, additional_kwargs)
+        self.llm = init_llm(
+            provider,
+            model,
+            additional_kwargs,
+            decoding_hints=SPECULATIVE_DECODING_HINTS,
+        )
+        # Per-layer `prompt | structured llm` chains, built on first use
+        self._chains: Dict[str, Runnable] = {}
     
-    def execute(
+    def _get_chain(self, layer_id: str, spec_model: type[BaseModel]) -> Runnable:
+        """Return the cached chain for a layer, composing it on first use."""
+        chain = self._chains.get(layer_id)
+        if chain is None:
+            llm_with_structure = self.llm.with_structured_output(
+                spec_model,
+                method="function_calling",
+            )
+            chain = _SPEC_PLANNER_PROMPT | llm_with_structure
+            self._chains[layer_id] = chain
+        return chain
+    
+    def _prepare(
         self,
         intent: Dict[str, Any],
         architecture: Dict[str, Any],
         layer_id: str,
         layer_constraints: Dict[str, Any]
-    ) -> BaseModel:
-        """Execute the spec planning logic for a specific layer.
+    ) -> Tuple[Runnable, Dict[str, str]]:
+        """Resolve the chain and prompt inputs for a specific layer.
         
         Args:
             intent: Validated intent specification dictionary
@@ -68,14 +96,13 @@ class SpecPlannerAgent:
             layer_constraints: Layer constraints from layer_constraints.json
             
         Returns:
-            Layer-specific spec model (BackendModelsSpec, DatabaseSpec, etc.)
+            Tuple of (chain, prompt inputs)
         """
         # Get the appropriate spec model for this layer
-        if layer_id not in LAYER_SPEC_MODELS:
+        spec_model = LAYER_SPEC_MODELS.get(layer_id)
+        if spec_model is None:
             raise ValueError(f"Unknown layer_id: {layer_id}")
         
-        spec_model = LAYER_SPEC_MODELS[layer_id]
-        
         # Find the layer in architecture
         layer_info = None
         for layer in architecture.get("execution_layers", []):
@@ -93,9 +120,9 @@ class SpecPlannerAgent:
         forbidden = layer_constraint.get("forbidden", [])
         must_define = layer_constraint.get("must_define", [])
         
-        # Format inputs for prompt
-        intent_str = json.dumps(intent, indent=2)
-        architecture_str = json.dumps(architecture, indent=2)
+        # Format inputs for prompt (compact JSON: indentation only adds tokens)
+        intent_str = dumps_compact(intent)
+        architecture_str = dumps_compact(architecture)
         
         layer_context = {
             "layer_id": layer_id,
@@ -107,52 +134,72 @@ class SpecPlannerAgent:
             "forbidden": forbidden,
             "must_define": must_define,
         }
-        layer_context_str = json.dumps(layer_context, indent=2)
+        layer_context_str = dumps_compact(layer_context)
         
-        # Create LLM chain with the specific spec model for this layer
-        llm_with_structure = self.llm.with_structured_output(spec_model, method="function_calling")
-        chain = SPEC_PLANNER_PROMPT | llm_with_structure
+        # Get LLM chain with the specific spec model for this layer
+        chain = self._get_chain(layer_id, spec_model)
         
-        # Invoke the chain
-        response = chain.invoke({
+        return chain, {
             "intent": intent_str,
             "architecture": architecture_str,
             "layer_context": layer_context_str,
             "layer_id": layer_id,
-        })
+        }
+    
+    def execute(
+        self,
+        intent: Dict[str, Any],
+        architecture: Dict[str, Any],
+        layer_id: str,
+        layer_constraints: Dict[str, Any]
+    ) -> BaseModel:
+        """Execute the spec planning logic for a specific layer.
         
-        return response
+        Args:
+            intent: Validated intent specification dictionary
+            architecture: Architecture plan dictionary
+            layer_id: The layer ID to generate a spec for
+            layer_constraints: Layer constraints from layer_constraints.json
+            
+        Returns:
+            Layer-specific spec model (BackendModelsSpec, DatabaseSpec, etc.)
+        """
+        chain, inputs = self._prepare(intent, architecture, layer_id, layer_constraints)
+        return chain.invoke(inputs)
     
-    def __call__(
+    async def aexecute(
+        self,
+        intent: Dict[str, Any],
+        architecture: Dict[str, Any],
+        layer_id: str,
+        layer_constraints: Dict[str, Any]
+    ) -> BaseModel:
+        """Async variant of `execute`."""
+        chain, inputs = self._prepare(intent, architecture, layer_id, layer_constraints)
+        return await chain.ainvoke(inputs)
+    
+    def _plan_layers(
         self,
         state: Dict[str, Any],
-        config: Optional[RunnableConfig] = None
-    ) -> Dict[str, Any]:
-        """LangGraph node interface.
+    ) -> Tuple[List[str], Dict[str, Dict[str, Any]]]:
+        """Validate state and decide which layer specs to regenerate or reuse.
         
         Args:
-            state: Current workflow state containing intent, architecture, and layer_constraints
-            config: Optional runtime configuration
+            state: Current workflow state
             
         Returns:
-            Updated state with spec_plan (list of all layer specs)
+            Tuple of (ordered layer ids, existing specs to reuse keyed by layer id)
         """
-        # Get stream writer for custom streaming
-        writer = get_stream_writer()
-        
-        # Extract inputs from state
-        intent = state.get("intent")
         architecture = state.get("architecture")
-        layer_constraints = state.get("layer_constraints")
         affected_layers = state.get("affected_layers")  # None in CREATE mode, list in MODIFY mode
         mode = state.get("mode")
         root_dir = state.get("root_dir")
         
-        if not intent:
+        if not state.get("intent"):
             raise ValueError("intent is required in state")
         if not architecture:
             raise ValueError("architecture is required in state")
-        if not layer_constraints:
+        if not state.get("layer_constraints"):
             raise ValueError("layer_constraints is required in state")
         
         # Get all execution layers from architecture
@@ -160,28 +207,21 @@ class SpecPlannerAgent:
         if not execution_layers:
             raise ValueError("architecture must contain at least one execution layer")
         
-        # Send custom message before execution
-        if writer:
-            writer({
-                "message": f"📋 Planning system specifications ({mode} mode)...",
-                "node": "spec_planner",
-                "status": "starting"
-            })
-        
         # Load existing spec plan if in MODIFY mode
         existing_spec_plan = None
         if mode == "MODIFY" and root_dir:
             spec_plan_path = root_dir / "spec" / "spec_plan.json"
             if spec_plan_path.exists():
-                with open(spec_plan_path, "r") as f:
-                    existing_spec_plan = json.load(f)
+                # Copy: the cached plan is shared and reused specs go into graph state
+                existing_spec_plan = clone(load_cached(spec_plan_path))
         
-        # Build spec plan
-        spec_plan = []
+        layer_ids = []
+        reused = {}
         for layer in execution_layers:
             layer_id = layer.get("id")
             if not layer_id:
                 raise ValueError(f"Layer missing 'id' field: {layer}")
+            layer_ids.append(layer_id)
             
             # Check if we need to regenerate this layer
             should_regenerate = (
@@ -190,57 +230,83 @@ class SpecPlannerAgent:
                 layer_id in affected_layers  # Layer is affected
             )
             
-            if should_regenerate:
-                # Regenerate spec for this layer
-                response = self.execute(
-                    intent=intent,
-                    architecture=architecture,
-                    layer_id=layer_id,
-                    layer_constraints=layer_constraints
+            # Reuse the existing spec for unaffected layers; regenerate if it is missing
+            if not should_regenerate and existing_spec_plan:
+                existing_layer_spec = next(
+                    (spec for spec in existing_spec_plan if spec.get("layer_id") == layer_id),
+                    None
                 )
-                
-                # Validate response
-                if not isinstance(response, BaseModel):
-                    raise ValueError(f"Unexpected response type for layer '{layer_id}': {type(response)}")
-                
-                # Add to spec plan
-                spec_plan.append({
-                    "layer_id": layer_id,
-                    "spec": response.model_dump(),
-                })
-            else:
-                # Reuse existing spec for this layer
-                if existing_spec_plan:
-                    existing_layer_spec = next(
-                        (spec for spec in existing_spec_plan if spec.get("layer_id") == layer_id),
-                        None
-                    )
-                    if existing_layer_spec:
-                        spec_plan.append(existing_layer_spec)
-                    else:
-                        # Fallback: regenerate if not found
-                        response = self.execute(
-                            intent=intent,
-                            architecture=architecture,
-                            layer_id=layer_id,
-                            layer_constraints=layer_constraints
-                        )
-                        spec_plan.append({
-                            "layer_id": layer_id,
-                            "spec": response.model_dump(),
-                        })
-                else:
-                    # No existing spec plan, regenerate
-                    response = self.execute(
-                        intent=intent,
-                        architecture=architecture,
-                        layer_id=layer_id,
-                        layer_constraints=layer_constraints
-                    )
-                    spec_plan.append({
-                        "layer_id": layer_id,
-                        "spec": response.model_dump(),
-                    })
+                if existing_layer_spec:
+                    reused[layer_id] = existing_layer_spec
+        
+        return layer_ids, reused
+    
+    @staticmethod
+    def _assemble_spec_plan(
+        layer_ids: List[str],
+        reused: Dict[str, Dict[str, Any]],
+        generated: Dict[str, BaseModel],
+    ) -> List[Dict[str, Any]]:
+        """Combine reused and freshly generated specs in architecture order."""
+        spec_plan = []
+        for layer_id in layer_ids:
+            if layer_id in reused:
+                spec_plan.append(reused[layer_id])
+                continue
+            
+            # Validate response
+            response = generated[layer_id]
+            if not isinstance(response, BaseModel):
+                raise ValueError(f"Unexpected response type for layer '{layer_id}': {type(response)}")
+            
+            spec_plan.append({
+                "layer_id": layer_id,
+                "spec": response.model_dump(),
+            })
+        return spec_plan
+    
+    def __call__(
+        self,
+        state: Dict[str, Any],
+        config: Optional[RunnableConfig] = None
+    ) -> Dict[str, Any]:
+        """LangGraph node interface.
+        
+        Args:
+            state: Current workflow state containing intent, architecture, and layer_constraints
+            config: Optional runtime configuration
+            
+        Returns:
+            Updated state with spec_plan (list of all layer specs)
+        """
+        # Get stream writer for custom streaming
+        writer = get_stream_writer()
+        mode = state.get("mode")
+        
+        layer_ids, reused = self._plan_layers(state)
+        
+        # Send custom message before execution
+        if writer:
+            writer({
+                "message": f"📋 Planning system specifications ({mode} mode)...",
+                "node": "spec_planner",
+                "status": "starting"
+            })
+        
+        generated = {
+            layer_id: self.execute(
+                intent=state["intent"],
+                architecture=state["architecture"],
+                layer_id=layer_id,
+                layer_constraints=state["layer_constraints"]
+            )
+            for layer_id in layer_ids
+            if layer_id not in reused
+        }
+        spec_plan = self._assemble_spec_plan(layer_ids, reused, generated)
+        
+        # Save spec plan to <root_dir>/spec/spec_plan.json
+        save_spec_json(state.get("root_dir"), "spec_plan.json", spec_plan, default=str)
         
         # Send custom message after execution
         if writer:
@@ -252,7 +318,54 @@ class SpecPlannerAgent:
         
         # Update state with all layer specs
         return {
-            **state,
+            "spec_plan": spec_plan,
+        }
+    
+    async def ainvoke(
+        self,
+        state: Dict[str, Any],
+        config: Optional[RunnableConfig] = None
+    ) -> Dict[str, Any]:
+        """Async LangGraph node interface.
+        
+        Same contract as `__call__`, but layer specs that need regenerating are
+        requested concurrently instead of one after another.
+        """
+        writer = get_stream_writer()
+        mode = state.get("mode")
+        
+        layer_ids, reused = self._plan_layers(state)
+        
+        if writer:
+            writer({
+                "message": f"📋 Planning system specifications ({mode} mode)...",
+                "node": "spec_planner",
+                "status": "starting"
+            })
+        
+        pending = [layer_id for layer_id in layer_ids if layer_id not in reused]
+        responses = await asyncio.gather(*[
+            asyncio.create_task(self.aexecute(
+                intent=state["intent"],
+                architecture=state["architecture"],
+                layer_id=layer_id,
+                layer_constraints=state["layer_constraints"]
+            ))
+            for layer_id in pending
+        ])
+        spec_plan = self._assemble_spec_plan(layer_ids, reused, dict(zip(pending, responses)))
+        
+        # Save spec plan to <root_dir>/spec/spec_plan.json
+        save_spec_json(state.get("root_dir"), "spec_plan.json", spec_plan, default=str)
+        
+        if writer:
+            writer({
+                "message": f"✅ Spec planning completed ({mode} mode).",
+                "node": "spec_planner",
+                "status": "completed",
+            })
+        
+        return {
             "spec_plan": spec_plan,
         }
 
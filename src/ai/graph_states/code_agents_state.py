@@ -1,11 +1,24 @@
 """State schema for the code agents graph."""
 
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Tuple
 from typing_extensions import TypedDict, Annotated
 import operator
 from pathlib import Path
 
 
+def _merge_manifests(
+    old: Optional[List[Dict[str, Any]]],
+    new: Optional[List[Dict[str, Any]]],
+) -> List[Dict[str, Any]]:
+    """Reducer for manifests: concatenate into a new list, like operator.add.
+    
+    Also accepts None on either side (the channel is Optional). Never mutates
+    its inputs: the first write is stored by reference, so extending in place
+    would leak into the caller's list, the parent state and checkpoints.
+    """
+    return (old or []) + (new or [])
+
+
 class CodeAgentsState(TypedDict, total=False):
     """
     State schema for the code agents workflow.
@@ -15,14 +28,16 @@ class CodeAgentsState(TypedDict, total=False):
     intent: Optional[Dict[str, Any]]  # Intent specification
     architecture: Optional[Dict[str, Any]]  # Architecture plan
     specs: Optional[List[Dict[str, Any]]]  # Specs of the layers
-    manifests: Optional[List[Dict[str, Any]]]  # Manifest of tasks/items
+    manifests: Annotated[Optional[List[Dict[str, Any]]], _merge_manifests]  # Manifest of tasks/items (agents return only their new manifests)
     existing_intent: Optional[Dict[str, Any]]  # Existing intent (for finalization)
     existing_architecture: Optional[Dict[str, Any]]  # Existing architecture (for finalization)
     affected_layers: Optional[List[str]]  # List of layer IDs affected by changes (for MODIFY mode)
 
     # === To determine execution order ===
-    execution_queue: Optional[List[str]]  # List of layer IDs in execution order
-    next_layer_index: Optional[int]  # Index of the next layer to execute
+    execution_queue: Optional[List[Tuple[str, str]]]  # (layer_id, path) pairs to generate
+    layer_dependencies: Optional[Dict[str, List[str]]]  # Queued layer ID -> queued layer IDs it depends on
+    completed_layers: Annotated[List[str], operator.add]  # Layer IDs generated so far
+    current_layer: Optional[Tuple[str, str]]  # (layer_id, path) for the agent receiving a Send
     
     # === Finalization ===
     requirements_text: Optional[str]  # Requirements.txt-like text with all dependencies
@@ -1,9 +1,7 @@
 """Flexible state schema for the orchestrator graph that evolves as agents are added."""
 
 from typing import Optional, Dict, Any, List
-from typing_extensions import TypedDict, Annotated
-from langchain_core.messages import AnyMessage
-import operator
+from typing_extensions import TypedDict
 from pathlib import Path
 
 
@@ -2,15 +2,23 @@
 
 from .orchestrator_graph import (
     create_orchestrator_graph,
+    get_orchestrator_graph,
+    ORCHESTRATOR_DURABILITY,
 )
 from .code_agents_graph import (
     create_code_agents_graph,
+    get_code_agents_graph,
     run_code_agents,
+    arun_code_agents,
 )
 
 __all__ = [
     "create_orchestrator_graph",
+    "get_orchestrator_graph",
+    "ORCHESTRATOR_DURABILITY",
     "create_code_agents_graph",
+    "get_code_agents_graph",
     "run_code_agents",
+    "arun_code_agents",
 ]
 
@@ -1,25 +1,38 @@
 """Code agents graph - placeholder for future implementation."""
 
 import uuid
+from functools import lru_cache
+from operator import itemgetter
 from typing import Dict, Any, Optional
 from pathlib import Path
 
 from langgraph.graph import StateGraph, END
-from langgraph.checkpoint.memory import MemorySaver
-from langchain_core.runnables import RunnableConfig
+from langgraph.types import Send
+from langchain_core.runnables import RunnableConfig, RunnableLambda
 
 from ..graph_states.code_agents_state import CodeAgentsState
-from ..agents.code_agents.backend_model_agent import BackendModelAgent
-from ..agents.code_agents.backend_service_agent import BackendServiceAgent
-from ..agents.code_agents.database_agent import DatabaseAgent
-from ..agents.code_agents.backend_router_agent import BackendRouterAgent
-from ..agents.code_agents.backend_app_agent import BackendAppAgent
-from ..agents.code_agents.frontend_agent import FrontendAgent
 from ..utils.system_config import system_config
 
 
+# Layer ID -> agent node that generates it
+_LAYER_TO_NODE = {
+    "backend_models": "backend_model_agent",
+    "backend_services": "backend_service_agent",
+    "backend_routes": "backend_route_agent",
+    "frontend_ui": "frontend_agent",
+    "database": "database_agent",
+    "backend_app": "backend_app_agent",
+}
+
+# Layer IDs that have implemented agents
+_IMPLEMENTED_LAYERS: frozenset[str] = frozenset(_LAYER_TO_NODE)
+
+# Layer dict -> (id, path) execution queue entry, in one C call per layer
+_layer_id_path = itemgetter("id", "path")
+
+
 def initialize_execution_queue(state: CodeAgentsState, config: Optional[RunnableConfig] = None) -> CodeAgentsState:
-    """Initialize the execution queue based on the architecture plan.
+    """Initialize the execution queue and layer dependency graph from the architecture plan.
     
     In MODIFY mode with affected_layers, only queue affected layers.
     In CREATE mode, queue all layers.
@@ -30,137 +43,168 @@ def initialize_execution_queue(state: CodeAgentsState, config: Optional[Runnable
     if not architecture:
         raise ValueError("architecture is required in state")
     
-    # Layer IDs that have implemented agents
-    implemented_layers = ["backend_models", "database", "backend_services", "backend_routes", "backend_app", "frontend_ui"]
-
-    # Get all layers from architecture
-    all_layers = [(layer["id"], layer["path"]) for layer in architecture["execution_layers"] if layer["id"] in implemented_layers]
+    # Get all layers from architecture that have implemented agents
+    all_layers = [layer for layer in architecture["execution_layers"] if layer["id"] in _IMPLEMENTED_LAYERS]
     
     # Filter to only affected layers if specified
     if affected_layers is not None:
-        execution_queue = [
-            (layer_id, layer_path) 
-            for layer_id, layer_path in all_layers 
-            if layer_id in affected_layers
-        ]
+        queued_layers = [layer for layer in all_layers if layer["id"] in affected_layers]
     else:
         # No filter: generate all layers (CREATE mode)
-        execution_queue = all_layers
+        queued_layers = all_layers
+    
+    execution_queue = list(map(_layer_id_path, queued_layers))
+    
+    # Only dependencies on queued layers gate scheduling; anything else is already generated
+    queued_ids = {layer_id for layer_id, _ in execution_queue}
+    layer_dependencies = {
+        layer["id"]: [dep for dep in layer.get("depends_on", []) if dep in queued_ids]
+        for layer in queued_layers
+    }
     
     return {
-        **state,
         "execution_queue": execution_queue,
-        "next_layer_index": 0,
+        "layer_dependencies": layer_dependencies,
     }
 
 
+def schedule_layers(state: CodeAgentsState, config: Optional[RunnableConfig] = None) -> CodeAgentsState:
+    """Join point after a batch of agents finishes; routing happens in global_router."""
+    return {}
+
+
+def _node_for_layer(layer_id: str) -> str:
+    """Map a layer ID to the agent node that generates it."""
+    node = _LAYER_TO_NODE.get(layer_id)
+    if node is None:
+        raise ValueError(f"Unknown layer: {layer_id}")
+    return node
+
+
 def global_router(state: CodeAgentsState, config: Optional[RunnableConfig] = None):
-    """Global router to determine the next layer to execute."""
-    next_layer_index = state.get("next_layer_index")
+    """Global router: fan out to every queued layer whose dependencies are complete.
+    
+    Layers that are ready at the same time are dispatched together with Send and
+    run in parallel. Returns END once every queued layer has been generated.
+    """
     execution_queue = state.get("execution_queue")
-    if next_layer_index == len(execution_queue):
-        return "finalize"
-    
-    next_node = execution_queue[next_layer_index][0]
-
-    if next_node == "backend_models":
-        return "backend_model_agent"
-    elif next_node == "backend_services":
-        return "backend_service_agent"
-    elif next_node == "backend_routes":
-        return "backend_route_agent"
-    elif next_node == "frontend_ui":
-        return "frontend_agent"
-    elif next_node == "database":
-        return "database_agent"
-    elif next_node == "backend_app":
-        return "backend_app_agent"
-    else:
-        raise ValueError(f"Unknown layer: {next_node}")
+    completed_layers = set(state.get("completed_layers") or [])
+    if len(completed_layers) == len(execution_queue):
+        return END
+    
+    layer_dependencies = state.get("layer_dependencies") or {}
+    ready_layers = [
+        (layer_id, layer_path)
+        for layer_id, layer_path in execution_queue
+        if layer_id not in completed_layers
+        and all(dep in completed_layers for dep in layer_dependencies.get(layer_id, []))
+    ]
+    if not ready_layers:
+        pending = [layer_id for layer_id, _ in execution_queue if layer_id not in completed_layers]
+        raise ValueError(f"No layer is ready to run; circular dependencies among: {pending}")
+    
+    return [
+        Send(_node_for_layer(layer_id), {**state, "current_layer": (layer_id, layer_path)})
+        for layer_id, layer_path in ready_layers
+    ]
+
+
+def _agent_node(agent) -> RunnableLambda:
+    """Wrap a code agent so sync runs use __call__ and async runs use its ainvoke."""
+    return RunnableLambda(agent, afunc=agent.ainvoke)
 
 
 def create_code_agents_graph():
     """Create and compile the code agents graph.
     
     Graph structure:
-    initialize_execution_queue -> backend_model_agent -> backend_service_agent -> backend_route_agent -> frontend_agent -> END
+    initialize_execution_queue -> [ready layer agents, in parallel] -> schedule_layers
+    -> [next ready layer agents] -> ... -> END
+    
+    A layer becomes ready once all layers it depends_on have been generated.
     """
-
-    # Create checkpointer for state persistence
-    checkpointer = MemorySaver()
+    # Import agents lazily: they pull in prompts, models and provider SDKs, which
+    # callers that never build this graph should not pay for at import time
+    from ..agents.code_agents.backend_model_agent import BackendModelAgent
+    from ..agents.code_agents.backend_service_agent import BackendServiceAgent
+    from ..agents.code_agents.database_agent import DatabaseAgent
+    from ..agents.code_agents.backend_router_agent import BackendRouterAgent
+    from ..agents.code_agents.backend_app_agent import BackendAppAgent
+    from ..agents.code_agents.frontend_agent import FrontendAgent
 
     # Create the graph
     workflow = StateGraph(CodeAgentsState)
     
     # Add nodes
     workflow.add_node("initialize_execution_queue", initialize_execution_queue)
-    workflow.add_node("backend_model_agent", BackendModelAgent(
+    workflow.add_node("schedule_layers", schedule_layers)
+    workflow.add_node("backend_model_agent", _agent_node(BackendModelAgent(
         provider=system_config["backend_model_agent"]["provider"],
         model=system_config["backend_model_agent"]["model"],
         additional_kwargs=system_config["backend_model_agent"]["additional_kwargs"],
-    ))
-    workflow.add_node("database_agent", DatabaseAgent(
+    )))
+    workflow.add_node("database_agent", _agent_node(DatabaseAgent(
         provider=system_config["database_agent"]["provider"],
         model=system_config["database_agent"]["model"],
         additional_kwargs=system_config["database_agent"]["additional_kwargs"],
-    ))
-    workflow.add_node("backend_service_agent", BackendServiceAgent(
+    )))
+    workflow.add_node("backend_service_agent", _agent_node(BackendServiceAgent(
         provider=system_config["backend_service_agent"]["provider"],
         model=system_config["backend_service_agent"]["model"],
         additional_kwargs=system_config["backend_service_agent"]["additional_kwargs"],
-    ))
-    workflow.add_node("backend_route_agent", BackendRouterAgent(
+    )))
+    workflow.add_node("backend_route_agent", _agent_node(BackendRouterAgent(
         provider=system_config["backend_router_agent"]["provider"],
         model=system_config["backend_router_agent"]["model"],
         additional_kwargs=system_config["backend_router_agent"]["additional_kwargs"],
-    ))
-    workflow.add_node("backend_app_agent", BackendAppAgent(
+    )))
+    workflow.add_node("backend_app_agent", _agent_node(BackendAppAgent(
         provider=system_config["backend_app_agent"]["provider"],
         model=system_config["backend_app_agent"]["model"],
         additional_kwargs=system_config["backend_app_agent"]["additional_kwargs"],
-    ))
-    workflow.add_node("frontend_agent", FrontendAgent(
+    )))
+    workflow.add_node("frontend_agent", _agent_node(FrontendAgent(
         provider=system_config["frontend_agent"]["provider"],
         model=system_config["frontend_agent"]["model"],
         additional_kwargs=system_config["frontend_agent"]["additional_kwargs"],
-    ))
+    )))
     
     # Add edges
     workflow.set_entry_point("initialize_execution_queue")
 
     workflow.add_conditional_edges("initialize_execution_queue", global_router)
-    workflow.add_conditional_edges("backend_model_agent", global_router)
-    workflow.add_conditional_edges("database_agent", global_router)
-    workflow.add_conditional_edges("backend_service_agent", global_router)
-    workflow.add_conditional_edges("backend_route_agent", global_router)
-    workflow.add_conditional_edges("backend_app_agent", global_router)
-    workflow.add_conditional_edges("frontend_agent", global_router)
+    # Agents running in the same step join here so the router runs once per step
+    workflow.add_edge("backend_model_agent", "schedule_layers")
+    workflow.add_edge("database_agent", "schedule_layers")
+    workflow.add_edge("backend_service_agent", "schedule_layers")
+    workflow.add_edge("backend_route_agent", "schedule_layers")
+    workflow.add_edge("backend_app_agent", "schedule_layers")
+    workflow.add_edge("frontend_agent", "schedule_layers")
+    workflow.add_conditional_edges("schedule_layers", global_router)
     
-    # Compile the graph
-    compiled = workflow.compile(checkpointer=checkpointer)
+    # Compile the graph without a checkpointer of its own: run as a subgraph it
+    # inherits the orchestrator's, and a saver shared by the cached graph would
+    # carry completed_layers/manifests over between runs on the same thread.
+    compiled = workflow.compile()
     
     return compiled
 
 
+@lru_cache(maxsize=1)
+def get_code_agents_graph():
+    """Return the code agents graph, compiling it on first use."""
+    return create_code_agents_graph()
+
+
 # ==================== Convenience Function ====================
 
-def run_code_agents(
-    intent: Dict[str, Any] = None,
-    architecture: Dict[str, Any] = None,
-    specs: list = None,
-    app_id: str = None,
+def _run_inputs(
+    intent: Dict[str, Any],
+    architecture: Dict[str, Any],
+    specs: list,
+    app_id: str,
 ):
-    """Run the code agents graph with given inputs and yield events.
-    
-    Args:
-        intent: Intent specification dictionary
-        architecture: Architecture plan dictionary
-        specs: List of spec dictionaries for each layer
-        app_id: Application identifier (used as thread_id)
-        
-    Yields:
-        Dictionary with 'node' and 'state' keys for each event
-    """
+    """Build the initial state and runnable config for a code agents run."""
     if not intent:
         raise ValueError("intent is required")
     if not architecture:
@@ -176,7 +220,7 @@ def run_code_agents(
         "specs": specs or [],
         "manifests": [],
         "execution_queue": None,
-        "next_layer_index": None,
+        "completed_layers": [],
     }
     
     # Create runnable config with UUID thread_id
@@ -186,15 +230,51 @@ def run_code_agents(
         }
     }
     
-    # Create and run the graph with streaming
-    graph = create_code_agents_graph()
-    
-    # Stream events and yield them
-    for event in graph.stream(initial_state, config=config):
-        # Each event is a dict with node names as keys
-        for node_name, node_output in event.items():
-            # Yield event information
-            yield {
-                "node": node_name,
-                "state": node_output if isinstance(node_output, dict) else None,
-            }
+    return initial_state, config
+
+
+def run_code_agents(
+    intent: Dict[str, Any] = None,
+    architecture: Dict[str, Any] = None,
+    specs: list = None,
+    app_id: str = None,
+):
+    """Run the code agents graph with given inputs and yield events.
+    
+    Args:
+        intent: Intent specification dictionary
+        architecture: Architecture plan dictionary
+        specs: List of spec dictionaries for each layer
+        app_id: Application identifier (used as thread_id)
+        
+    Yields:
+        (node_name, update) tuples, where update is the state delta the node wrote
+    """
+    initial_state, config = _run_inputs(intent, architecture, specs, app_id)
+    
+    # Run the shared compiled graph, streaming per-node updates (deltas, not full state)
+    graph = get_code_agents_graph()
+    for event in graph.stream(initial_state, config=config, stream_mode="updates"):
+        # Each event maps node names to their updates
+        yield from event.items()
+
+
+async def arun_code_agents(
+    intent: Dict[str, Any] = None,
+    architecture: Dict[str, Any] = None,
+    specs: list = None,
+    app_id: str = None,
+):
+    """Async variant of `run_code_agents` built on `graph.astream`.
+    
+    Agents dispatched in the same step await their LLM calls concurrently.
+    
+    Yields:
+        (node_name, update) tuples, where update is the state delta the node wrote
+    """
+    initial_state, config = _run_inputs(intent, architecture, specs, app_id)
+    
+    graph = get_code_agents_graph()
+    async for event in graph.astream(initial_state, config=config, stream_mode="updates"):
+        for item in event.items():
+            yield item
@@ -1,25 +1,41 @@
 """Orchestrator graph that coordinates intent interpreter and architect agents."""
  
-import json
 import uuid
-import copy
-import os
-import stat
+from functools import lru_cache
+from importlib import resources
+from itertools import chain
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
 
-from langchain_core.runnables import RunnableConfig
+from langchain_core.runnables import RunnableConfig, RunnableLambda
 from langgraph.graph import StateGraph, END
 from langgraph.checkpoint.memory import MemorySaver
 from langgraph.config import get_stream_writer
 
 from ..graph_states.orchestrator_state import OrchestratorState
 from ..graph_states.code_agents_state import CodeAgentsState
-from ..agents.intent_interpreter_agent import IntentInterpreterAgent
-from ..agents.architect_agent import ArchitectAgent
-from ..agents.spec_planner_agent import SpecPlannerAgent
-from .code_agents_graph import create_code_agents_graph
+from .code_agents_graph import get_code_agents_graph
 from ..utils.system_config import system_config
+from ..utils.json_utils import load_cached, content_hash, clone
+from ..utils.cache_utils import lru_cache_by
+from ..utils.file_utils import write_file
+
+# Startup script copied into every generated app
+_RUN_SH = resources.files(__package__).joinpath("templates/run.sh").read_bytes()
+
+AGENT_REGISTRY_PATH = Path("src/ai/utils/agent_registry.json")
+LAYER_CONSTRAINTS_PATH = Path("src/ai/utils/layer_constraints.json")
+
+
+def _load_config_json(path: Path, default: Any) -> Any:
+    """Load a config JSON file through the mtime-keyed cache, or return default if missing.
+    
+    Returns a copy: the cached object is shared, and the result goes into graph state.
+    """
+    try:
+        return clone(load_cached(path))
+    except FileNotFoundError:
+        return default
 
 
 def initialize_graph(state: OrchestratorState, config: Optional[RunnableConfig] = None) -> OrchestratorState:
@@ -41,27 +57,17 @@ def initialize_graph(state: OrchestratorState, config: Optional[RunnableConfig]
     # existing_intent and existing_architecture should always come from state (checkpoint)
     # They are set by the finalize node after code generation completes
     
-    # Load agent registry if not already in state
+    # Load agent registry / layer constraints if not already in state. Parsed
+    # files are cached per process and reloaded only when they change on disk.
     agent_registry = state.get("agent_registry")
     if agent_registry is None:
-        registry_path = Path("src/ai/utils/agent_registry.json")
-        if registry_path.exists():
-            with open(registry_path, "r") as f:
-                agent_registry = json.load(f)
-        else:
-            agent_registry = []
+        agent_registry = _load_config_json(AGENT_REGISTRY_PATH, default=[])
     
-    # Load layer constraints if not already in state
     layer_constraints = state.get("layer_constraints")
     if layer_constraints is None:
-        layer_constraints_path = Path("src/ai/utils/layer_constraints.json")
-        layer_constraints = {}
-        if layer_constraints_path.exists():
-            with open(layer_constraints_path, "r") as f:
-                layer_constraints = json.load(f)
+        layer_constraints = _load_config_json(LAYER_CONSTRAINTS_PATH, default={})
     
     return {
-        **state,
         "root_dir": root_dir,
         "mode": mode,
         "agent_registry": agent_registry,
@@ -70,37 +76,10 @@ def initialize_graph(state: OrchestratorState, config: Optional[RunnableConfig]
     
 
 
-# ==================== Save Nodes ====================
-
-def save_intent_node(state: OrchestratorState, config: Optional[RunnableConfig] = None) -> OrchestratorState:
-    """Save intent to spec directory using root_dir from state.
-    
-    Saves intent.json to <root_dir>/spec/intent.json
-    """
-    intent = state.get("intent")
-    
-    if not intent:
-        # Nothing to save
-        return state
-    
-    # Get root_dir from state
-    root_dir = state.get("root_dir")
-    if not root_dir:
-        raise ValueError("root_dir is required in state to save intent")
-    
-    # Create directory structure: <root_dir>/spec/
-    spec_dir = root_dir / "spec"
-    spec_dir.mkdir(parents=True, exist_ok=True)
-    
-    # File path
-    file_path = spec_dir / "intent.json"
-    
-    # Save intent as JSON
-    with open(file_path, "w") as f:
-        json.dump(intent, f, indent=4)
-    
-    # Return state unchanged (no saved_files tracking)
-    return state
+def _emit(writer, node: str, status: str, message: str) -> None:
+    """Send a custom progress message through the node's stream writer, if any."""
+    if writer:
+        writer({"message": message, "node": node, "status": status})
 
 
 # ==================== Impact Analysis Node ====================
@@ -120,23 +99,17 @@ def impact_analysis_node(state: OrchestratorState, config: Optional[RunnableConf
     
     mode = state.get("mode")
     
-    # Send custom message before execution
-    if writer:
-        writer({
-            "message": f"🔍 Analyzing impact of changes ({mode} mode)...",
-            "node": "impact_analysis",
-            "status": "starting"
-        })
-    
-    # In CREATE mode, skip impact analysis (all layers will be generated)
+    # In CREATE mode, skip impact analysis (all layers will be generated). This is
+    # instant, so only the completion message is sent.
     if mode == "CREATE":
         result = {
-            **state,
             "affected_layers": None,  # None means all layers
             "impact_analysis_changes": None,  # No changes in CREATE mode
         }
     else:
         # In MODIFY mode, perform impact analysis
+        _emit(writer, "impact_analysis", "starting", f"🔍 Analyzing impact of changes ({mode} mode)...")
+        
         existing_intent = state.get("existing_intent")
         new_intent = state.get("intent")
         architecture = state.get("architecture")
@@ -145,35 +118,64 @@ def impact_analysis_node(state: OrchestratorState, config: Optional[RunnableConf
             # If we don't have enough info, regenerate all layers to be safe
             all_layer_ids = [layer.get("id") for layer in architecture.get("execution_layers", [])]
             result = {
-                **state,
                 "affected_layers": all_layer_ids,
                 "impact_analysis_changes": None,  # Could not analyze changes
             }
         else:
-            # Analyze changes
-            changes = _analyze_intent_changes(existing_intent, new_intent)
+            old_hash = content_hash(existing_intent)
+            new_hash = content_hash(new_intent)
             
-            # Determine affected layers
-            affected_layers = _determine_affected_layers(changes, architecture)
-            
-            result = {
-                **state,
-                "affected_layers": affected_layers,
-                "impact_analysis_changes": changes,  # Store detailed changes for results
-            }
+            if old_hash == new_hash:
+                # Intent content is unchanged: nothing to diff, no layer needs regenerating
+                _emit(writer, "impact_analysis", "in_progress", "ℹ️ No intent changes detected.")
+                result = {
+                    "affected_layers": [],
+                    "impact_analysis_changes": clone(_EMPTY_CHANGES),
+                }
+            else:
+                # Analyze changes and determine affected layers
+                changes, affected_layers = _analyze_impact_cached(
+                    old_hash, new_hash, existing_intent, new_intent, architecture
+                )
+                
+                result = {
+                    "affected_layers": affected_layers,
+                    "impact_analysis_changes": changes,  # Store detailed changes for results
+                }
     
     # Send custom message after execution
-    if writer:
-        affected_count = len(result.get("affected_layers", [])) if result.get("affected_layers") is not None else "all"
-        writer({
-            "message": f"✅ Impact analysis completed ({mode} mode). Affected layers: {affected_count}",
-            "node": "impact_analysis",
-            "status": "completed",
-        })
+    affected_layers = result["affected_layers"]
+    affected_count = len(affected_layers) if affected_layers is not None else "all"
+    _emit(
+        writer,
+        "impact_analysis",
+        "completed",
+        f"✅ Impact analysis completed ({mode} mode). Affected layers: {affected_count}",
+    )
     
     return result
 
 
+# What _analyze_intent_changes returns for identical intents
+_EMPTY_CHANGES = {
+    "entities_added": [],
+    "entities_removed": [],
+    "entities_modified": {},
+    "operations_changed": {},
+    "ui_changed": False,
+}
+
+
+def _index_by(items: list, key: str) -> dict:
+    """Index a list of dicts by one of their fields, skipping items without it."""
+    index = {}
+    for item in items:
+        name = item.get(key)
+        if name:
+            index[name] = item
+    return index
+
+
 def _analyze_intent_changes(old_intent: dict, new_intent: dict) -> dict:
     """Compare old and new intent to identify changes.
     
@@ -193,74 +195,54 @@ def _analyze_intent_changes(old_intent: dict, new_intent: dict) -> dict:
     }
     
     # primary_entities is a list of entity objects, not a dict
-    # Convert to dict keyed by entity name for easier comparison
-    old_entities_list = old_intent.get("primary_entities", [])
-    new_entities_list = new_intent.get("primary_entities", [])
-    
-    # Convert lists to dicts: {entity_name: entity_object}
-    old_entities = {entity.get("name"): entity for entity in old_entities_list if entity.get("name")}
-    new_entities = {entity.get("name"): entity for entity in new_entities_list if entity.get("name")}
+    # Index by entity name in one pass; dict key views support set operations directly
+    old_entities = _index_by(old_intent.get("primary_entities", []), "name")
+    new_entities = _index_by(new_intent.get("primary_entities", []), "name")
     
     # Check for added/removed entities
-    old_entity_names = set(old_entities.keys())
-    new_entity_names = set(new_entities.keys())
-    
-    changes["entities_added"] = list(new_entity_names - old_entity_names)
-    changes["entities_removed"] = list(old_entity_names - new_entity_names)
+    changes["entities_added"] = list(new_entities.keys() - old_entities.keys())
+    changes["entities_removed"] = list(old_entities.keys() - new_entities.keys())
     
     # Check for modified entities (field changes)
-    for entity_name in new_entity_names & old_entity_names:
+    for entity_name in new_entities.keys() & old_entities.keys():
         old_entity = old_entities[entity_name]
         new_entity = new_entities[entity_name]
         
-        # Fields are also lists, convert to dicts for comparison
-        old_fields_list = old_entity.get("fields", [])
-        new_fields_list = new_entity.get("fields", [])
+        # Identical entities cannot have field changes
+        if old_entity is new_entity or old_entity == new_entity:
+            continue
         
-        old_fields = {field.get("name"): field for field in old_fields_list if field.get("name")}
-        new_fields = {field.get("name"): field for field in new_fields_list if field.get("name")}
+        # Fields are also lists, index them by name the same way
+        old_fields = _index_by(old_entity.get("fields", []), "name")
+        new_fields = _index_by(new_entity.get("fields", []), "name")
         
-        field_changes = {
-            "fields_added": [],
-            "fields_removed": [],
-            "fields_modified": [],
-        }
-        
-        old_field_names = set(old_fields.keys())
-        new_field_names = set(new_fields.keys())
+        fields_added = list(new_fields.keys() - old_fields.keys())
+        fields_removed = list(old_fields.keys() - new_fields.keys())
         
-        field_changes["fields_added"] = list(new_field_names - old_field_names)
-        field_changes["fields_removed"] = list(old_field_names - new_field_names)
+        # Check for modified field types/requirements (identity check first)
+        fields_modified = [
+            field_name
+            for field_name in old_fields.keys() & new_fields.keys()
+            if old_fields[field_name] is not new_fields[field_name]
+            and old_fields[field_name] != new_fields[field_name]
+        ]
         
-        # Check for modified field types/requirements
-        for field_name in old_field_names & new_field_names:
-            if old_fields[field_name] != new_fields[field_name]:
-                field_changes["fields_modified"].append(field_name)
-        
-        if any(field_changes.values()):
-            changes["entities_modified"][entity_name] = field_changes
+        if fields_added or fields_removed or fields_modified:
+            changes["entities_modified"][entity_name] = {
+                "fields_added": fields_added,
+                "fields_removed": fields_removed,
+                "fields_modified": fields_modified,
+            }
     
     # Check for operation changes
     # operations is a list of objects: [{"entity_name": "Expense", "operations": ["create", "read"]}, ...]
-    old_operations_list = old_intent.get("operations", [])
-    new_operations_list = new_intent.get("operations", [])
-    
-    # Convert to dicts: {entity_name: set_of_operations}
-    old_operations = {}
-    for op_obj in old_operations_list:
-        entity_name = op_obj.get("entity_name")
-        if entity_name:
-            old_operations[entity_name] = set(op_obj.get("operations", []))
-    
-    new_operations = {}
-    for op_obj in new_operations_list:
-        entity_name = op_obj.get("entity_name")
-        if entity_name:
-            new_operations[entity_name] = set(op_obj.get("operations", []))
-    
-    for entity_name in set(old_operations.keys()) | set(new_operations.keys()):
-        old_ops = old_operations.get(entity_name, set())
-        new_ops = new_operations.get(entity_name, set())
+    # Keep the raw operation lists and only build sets where they are compared
+    old_operations = _index_by(old_intent.get("operations", []), "entity_name")
+    new_operations = _index_by(new_intent.get("operations", []), "entity_name")
+    
+    for entity_name in old_operations.keys() | new_operations.keys():
+        old_ops = set(old_operations[entity_name].get("operations", [])) if entity_name in old_operations else set()
+        new_ops = set(new_operations[entity_name].get("operations", [])) if entity_name in new_operations else set()
         
         if old_ops != new_ops:
             changes["operations_changed"][entity_name] = {
@@ -276,113 +258,115 @@ def _analyze_intent_changes(old_intent: dict, new_intent: dict) -> dict:
     return changes
 
 
+@lru_cache_by(
+    lambda old_hash, new_hash, old_intent, new_intent, architecture: (
+        old_hash,
+        new_hash,
+        tuple(layer.get("id") for layer in architecture.get("execution_layers", [])),
+    ),
+    maxsize=32,
+)
+def _analyze_impact(
+    old_hash: bytes,
+    new_hash: bytes,
+    old_intent: dict,
+    new_intent: dict,
+    architecture: dict,
+) -> Tuple[dict, list]:
+    """Memoized `_analyze_intent_changes` + `_determine_affected_layers`.
+    
+    The affected layers depend on the architecture only through its ordered
+    layer ids, so those (not the whole architecture) complete the key. Retries
+    and replays with the same inputs skip both steps.
+    """
+    changes = _analyze_intent_changes(old_intent, new_intent)
+    return changes, _determine_affected_layers(changes, architecture)
+
+
+def _analyze_impact_cached(
+    old_hash: bytes,
+    new_hash: bytes,
+    old_intent: dict,
+    new_intent: dict,
+    architecture: dict,
+) -> Tuple[dict, list]:
+    """`_analyze_impact`, copied on the way out so callers never share the cached objects."""
+    changes, affected_layers = _analyze_impact(old_hash, new_hash, old_intent, new_intent, architecture)
+    return clone(changes), list(affected_layers)
+
+
+# Rule 3: Entity fields modified → most layers affected
+_RULE_ENTITIES_MODIFIED = frozenset({
+    "backend_models",    # Pydantic models need field updates
+    "database",          # SQL schema needs column updates
+    "backend_services",  # Service functions use models
+    "backend_routes",    # Routes use models for request/response
+    "frontend_ui",       # Forms need new fields
+})
+
+# Rule 4: Operations changed → affects service/route/UI layers
+_RULE_OPS_CHANGED = frozenset({
+    "backend_services",  # New/removed functions
+    "backend_routes",    # New/removed endpoints
+    "frontend_ui",       # New/removed views
+})
+
+# Rule 5: UI-only changes → only frontend affected
+_RULE_UI_ONLY = frozenset({"frontend_ui"})
+
+# (predicate over changes, layers affected when it holds) for Rules 3-5
+_RULES = (
+    (lambda changes: changes["entities_modified"], _RULE_ENTITIES_MODIFIED),
+    (lambda changes: changes["operations_changed"], _RULE_OPS_CHANGED),
+    (
+        lambda changes: changes["ui_changed"] and not changes["entities_modified"] and not changes["operations_changed"],
+        _RULE_UI_ONLY,
+    ),
+)
+
+
 def _determine_affected_layers(changes: dict, architecture: dict) -> list:
     """Map intent changes to affected layers.
     
     Returns list of layer IDs that need regeneration.
     """
-    affected = set()
-    
     # Get all layer IDs from architecture
     all_layer_ids = [layer.get("id") for layer in architecture.get("execution_layers", [])]
     
     # Rule 1: New entity added → all layers affected
-    if changes["entities_added"]:
-        return all_layer_ids
-    
     # Rule 2: Entity removed → all layers affected (need to remove references)
-    if changes["entities_removed"]:
+    if changes["entities_added"] or changes["entities_removed"]:
         return all_layer_ids
     
-    # Rule 3: Entity fields modified → most layers affected
-    if changes["entities_modified"]:
-        affected.update([
-            "backend_models",    # Pydantic models need field updates
-            "database",          # SQL schema needs column updates
-            "backend_services",  # Service functions use models
-            "backend_routes",    # Routes use models for request/response
-            "frontend_ui",       # Forms need new fields
-        ])
-    
-    # Rule 4: Operations changed → affects service/route/UI layers
-    if changes["operations_changed"]:
-        affected.update([
-            "backend_services",  # New/removed functions
-            "backend_routes",    # New/removed endpoints
-            "frontend_ui",       # New/removed views
-        ])
-    
-    # Rule 5: UI-only changes → only frontend affected
-    if changes["ui_changed"] and not changes["entities_modified"] and not changes["operations_changed"]:
-        affected.add("frontend_ui")
+    # Rules 3-5: union of the precomputed layer sets whose predicate holds
+    affected = frozenset().union(*(layers for predicate, layers in _RULES if predicate(changes)))
     
     # Filter to only layers that exist in architecture
     return [layer_id for layer_id in all_layer_ids if layer_id in affected]
 
 
-def save_architecture_node(state: OrchestratorState, config: Optional[RunnableConfig] = None) -> OrchestratorState:
-    """Save architecture to spec directory using root_dir from state.
-    
-    Saves architecture.json to <root_dir>/spec/architecture.json
-    """
-    architecture = state.get("architecture")
-    
-    if not architecture:
-        # Nothing to save
-        return state
-    
-    # Get root_dir from state
-    root_dir = state.get("root_dir")
-    if not root_dir:
-        raise ValueError("root_dir is required in state to save architecture")
-    
-    # Create directory structure: <root_dir>/spec/
-    spec_dir = root_dir / "spec"
-    spec_dir.mkdir(parents=True, exist_ok=True)
-    
-    # File path
-    file_path = spec_dir / "architecture.json"
-    
-    # Save architecture as JSON
-    with open(file_path, "w") as f:
-        json.dump(architecture, f, indent=4, default=str)
-    
-    # Return state unchanged (no saved_files tracking)
-    return state
+# ==================== Finalize Node ====================
+
+# Shared immutable default for missing manifest lists
+_EMPTY: tuple = ()
 
 
-def save_spec_plan_node(state: OrchestratorState, config: Optional[RunnableConfig] = None) -> OrchestratorState:
-    """Save spec plan to spec directory using root_dir from state.
+def _iter_dependencies(manifests: list):
+    """Yield every non-empty dependency string from the manifests, stripped.
     
-    Saves spec_plan.json to <root_dir>/spec/spec_plan.json
+    Both nesting levels are flattened by `chain.from_iterable` in C. Most
+    entries are already clean, so strip() (and its new string) is only paid
+    for entries with surrounding whitespace.
     """
-    spec_plan = state.get("spec_plan")
-    
-    if not spec_plan:
-        # Nothing to save
-        return state
-    
-    # Get root_dir from state
-    root_dir = state.get("root_dir")
-    if not root_dir:
-        raise ValueError("root_dir is required in state to save spec_plan")
-    
-    # Create directory structure: <root_dir>/spec/
-    spec_dir = root_dir / "spec"
-    spec_dir.mkdir(parents=True, exist_ok=True)
-    
-    # File path
-    file_path = spec_dir / "spec_plan.json"
-    
-    # Save spec_plan as JSON
-    with open(file_path, "w") as f:
-        json.dump(spec_plan, f, indent=4, default=str)
-    
-    # Return state unchanged (no saved_files tracking)
-    return state
-
+    manifest_files = chain.from_iterable(
+        manifest.get("manifest_files", _EMPTY) for manifest in manifests
+    )
+    for dep in chain.from_iterable(
+        manifest_file.get("dependencies", _EMPTY) for manifest_file in manifest_files
+    ):
+        if dep:
+            yield dep.strip() if dep[0].isspace() or dep[-1].isspace() else dep
 
-# ==================== Finalize Node ====================
 
 def finalize_node(state: OrchestratorState, config: Optional[RunnableConfig] = None) -> OrchestratorState:
     """Finalize the code generation by creating helper files and saving existing intent/architecture.
@@ -400,238 +384,129 @@ def finalize_node(state: OrchestratorState, config: Optional[RunnableConfig] = N
     if not root_dir:
         raise ValueError("root_dir is required in state")
     
-    manifests = state.get("manifests", [])
-    
-    # Collect all unique dependencies from all manifests
-    all_dependencies = set()
+    # Send custom message before the file writes
+    _emit(writer, "finalize", "starting", "📦 Finalizing app setup...")
     
-    # Cycle through each manifest
-    for manifest in manifests:
-        # Get manifest_files for this layer
-        manifest_files = manifest.get("manifest_files", [])
-        
-        # For each file in the manifest
-        for manifest_file in manifest_files:
-            # Get dependencies for this file
-            dependencies = manifest_file.get("dependencies", [])
-            
-            # Add each dependency to the set (automatically handles uniqueness)
-            for dep in dependencies:
-                if dep:  # Only add non-empty dependencies
-                    all_dependencies.add(dep.strip())
+    manifests = state.get("manifests", [])
     
-    # Sort dependencies alphabetically for consistent output
-    sorted_dependencies = sorted(all_dependencies)
+    # Collect all unique, non-empty dependencies from all manifests and sort
+    # them alphabetically for consistent output
+    sorted_dependencies = sorted(set(_iter_dependencies(manifests)))
     
     # Create requirements.txt-like text
     # Format: one dependency per line
     requirements_text = "\n".join(sorted_dependencies)
 
-    with open(root_dir / "requirements.txt", "w") as f:
-        f.write(requirements_text)
-
-    # Create run.sh
-    run_sh_content = """#!/bin/bash
-
-# Generated App - Startup Script
-# This script sets up and runs both backend and frontend
-
-set -e  # Exit on error
-
-APP_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
-cd "$APP_DIR"
-
-echo "🚀 Starting App Setup..."
-echo "━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━"
-
-# Step 1: Check Python
-echo ""
-echo "📋 Step 1/4: Checking Python installation..."
-if ! command -v python3 &> /dev/null; then
-    echo "❌ Python 3 is not installed. Please install Python 3.8 or higher."
-    exit 1
-fi
-echo "✅ Python found: $(python3 --version)"
-
-# Step 2: Install dependencies
-echo ""
-echo "📦 Step 2/4: Installing dependencies..."
-if command -v uv &> /dev/null; then
-    echo "Using uv for faster installation..."
-    uv pip install -r requirements.txt
-else
-    echo "Using pip..."
-    pip3 install -r requirements.txt
-fi
-echo "✅ Dependencies installed"
-
-# Step 3: Initialize database
-echo ""
-echo "🗄️  Step 3/4: Initializing database..."
-# Delete existing database if it exists (for fresh initialization)
-DB_PATH="$APP_DIR/app.db"
-if [ -f "$DB_PATH" ]; then
-    echo "Removing existing database..."
-    rm -f "$DB_PATH"
-    echo "✅ Existing database removed"
-fi
-PYTHONPATH="$APP_DIR:$PYTHONPATH" python3 -c "from backend.db.init_db import init_database; init_database(); print('✅ Database initialized')"
-
-# Step 4: Start services
-echo ""
-echo "🚀 Step 4/4: Starting services..."
-echo "━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━"
-echo ""
-echo "Starting Backend API on http://localhost:1234"
-echo "Starting Frontend UI on http://localhost:4321"
-echo ""
-echo "Press Ctrl+C to stop all services"
-echo "━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━"
-echo ""
-
-# Function to cleanup on exit
-cleanup() {
-    echo ""
-    echo "🛑 Stopping services..."
-    kill $BACKEND_PID $FRONTEND_PID 2>/dev/null
-    echo "✅ All services stopped"
-    exit 0
-}
+    write_file(root_dir / "requirements.txt", requirements_text.encode())
 
-trap cleanup SIGINT SIGTERM
-
-# Start backend
-PYTHONPATH="$APP_DIR:$PYTHONPATH" python3 -m uvicorn backend.main:app --host 0.0.0.0 --port 1234 > backend.log 2>&1 &
-BACKEND_PID=$!
-echo "✅ Backend started (PID: $BACKEND_PID)"
-sleep 3  # Give backend time to start
-
-# Check if backend is actually running
-if ! kill -0 $BACKEND_PID 2>/dev/null; then
-    echo "❌ Backend failed to start. Check backend.log for details:"
-    tail -n 20 backend.log
-    exit 1
-fi
-
-# Start frontend
-PYTHONPATH="$APP_DIR:$PYTHONPATH" streamlit run frontend/app.py > frontend.log 2>&1 &
-FRONTEND_PID=$!
-echo "✅ Frontend started (PID: $FRONTEND_PID)"
-sleep 3  # Give frontend time to start
-
-# Check if frontend is actually running
-if ! kill -0 $FRONTEND_PID 2>/dev/null; then
-    echo "❌ Frontend failed to start. Check frontend.log for details:"
-    tail -n 20 frontend.log
-    kill $BACKEND_PID 2>/dev/null
-    exit 1
-fi
-
-echo ""
-echo "━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━"
-echo "🎉 App is running!"
-echo "━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━"
-echo ""
-echo "📍 Backend API:  http://localhost:1234"
-echo "📍 API Docs:     http://localhost:1234/docs"
-echo "📍 Frontend UI:  http://localhost:4321"
-echo ""
-echo "📝 Logs:"
-echo "   Backend:  tail -f backend.log"
-echo "   Frontend: tail -f frontend.log"
-echo ""
-echo "Press Ctrl+C to stop all services"
-echo "━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━"
-
-# Wait for processes
-wait $BACKEND_PID $FRONTEND_PID
-"""
-    
-    run_sh_path = root_dir / "run.sh"
-    with open(run_sh_path, "w") as f:
-        f.write(run_sh_content)
-    
-    # Make run.sh executable
-    os.chmod(run_sh_path, os.stat(run_sh_path).st_mode | stat.S_IEXEC)
+    # Create run.sh (created executable, so no separate chmod is needed)
+    write_file(root_dir / "run.sh", _RUN_SH, 0o755)
 
     # Copy intent to existing_intent and architecture to existing_architecture for next run
     intent = state.get("intent")
     architecture = state.get("architecture")
     
-    # Send custom message before execution
-    if writer:
-        writer({
-            "message": "📦 Finalizing app setup...",
-            "node": "finalize",
-            "status": "starting"
-        })
-    
-    result = {
-        **state,
+    _emit(writer, "finalize", "completed", "✅ App finalization completed.")
+    
+    return {
         "requirements_text": requirements_text,
-        "existing_intent": copy.deepcopy(intent) if intent else None,
-        "existing_architecture": copy.deepcopy(architecture) if architecture else None,
+        "existing_intent": clone(intent) if intent else None,
+        "existing_architecture": clone(architecture) if architecture else None,
     }
-    
-    # Send custom message after execution
-    if writer:
-        writer({
-            "message": "✅ App finalization completed.",
-            "node": "finalize",
-            "status": "completed",
-        })
-    
-    return result
 
 
 # ==================== Code Agents Wrapper Node ====================
 
+# The code agents run has no mid-run resume or human-in-the-loop step, so its
+# checkpoint is persisted once when it exits rather than after every super-step
+CODE_AGENTS_DURABILITY = "exit"
+
+# Keys passed through unchanged from OrchestratorState to CodeAgentsState
+# (affected_layers drives selective regeneration)
+_CODE_AGENTS_KEYS = (
+    "intent",
+    "architecture",
+    "root_dir",
+    "existing_intent",
+    "existing_architecture",
+    "affected_layers",
+)
+
+def _code_agents_input(state: OrchestratorState) -> CodeAgentsState:
+    """Map OrchestratorState to the CodeAgentsState expected by the code agents graph."""
+    code_agents_input = {key: state.get(key) for key in _CODE_AGENTS_KEYS}
+    code_agents_input["specs"] = state.get("spec_plan") or []  # Map spec_plan to specs
+    code_agents_input["manifests"] = []
+    code_agents_input["execution_queue"] = None
+    code_agents_input["completed_layers"] = []
+    return code_agents_input
+
+
 def code_agents_wrapper_node(state: OrchestratorState, config: Optional[RunnableConfig] = None) -> OrchestratorState:
     """Wrapper node that maps OrchestratorState to CodeAgentsState and invokes the code agents graph.
     
     This is needed because the compiled code agents graph expects CodeAgentsState,
     but the orchestrator uses OrchestratorState.
     """
-    # Map OrchestratorState to CodeAgentsState
-    code_agents_input: CodeAgentsState = {
-        "intent": state.get("intent"),
-        "architecture": state.get("architecture"),
-        "specs": state.get("spec_plan") or [],  # Map spec_plan to specs
-        "manifests": [],
-        "execution_queue": None,
-        "next_layer_index": None,
-        "root_dir": state.get("root_dir"),
-        "existing_intent": state.get("existing_intent"),
-        "existing_architecture": state.get("existing_architecture"),
-        "affected_layers": state.get("affected_layers"),  # Pass affected_layers for selective regeneration
-    }
-    
-    # Get the compiled code agents graph
-    code_agents_graph = create_code_agents_graph()
-    
-    # Invoke the code agents graph
-    result = code_agents_graph.invoke(code_agents_input, config=config)
+    # Get the shared compiled code agents graph
+    code_agents_graph = get_code_agents_graph()
+    
+    # Invoke the code agents graph, checkpointing only once it exits
+    result = code_agents_graph.invoke(
+        _code_agents_input(state),
+        config=config,
+        durability=CODE_AGENTS_DURABILITY,
+    )
     
     # Map result back to OrchestratorState
     # Just update manifests - finalization will happen in the finalize node
     return {
-        **state,
+        "manifests": result.get("manifests") if isinstance(result, dict) else None,
+    }
+
+
+async def acode_agents_wrapper_node(state: OrchestratorState, config: Optional[RunnableConfig] = None) -> OrchestratorState:
+    """Async variant of `code_agents_wrapper_node`; runs the code agents graph with ainvoke."""
+    code_agents_graph = get_code_agents_graph()
+    
+    result = await code_agents_graph.ainvoke(
+        _code_agents_input(state),
+        config=config,
+        durability=CODE_AGENTS_DURABILITY,
+    )
+    
+    return {
         "manifests": result.get("manifests") if isinstance(result, dict) else None,
     }
 
 
 # ==================== Graph Construction ====================
 
+# State only has to survive between runs of a thread (the next run reads
+# existing_intent/existing_architecture from it), so the orchestrator is
+# checkpointed once when a run exits instead of after each of its super-steps
+ORCHESTRATOR_DURABILITY = "exit"
+
+
 def create_orchestrator_graph():
     """Create and compile the orchestrator graph.
     
     Graph structure:
-    initialize_graph -> intent_interpreter -> save_intent -> architect -> save_architecture 
-    -> impact_analysis -> spec_planner -> save_spec_plan -> code_agents -> END
+    initialize_graph -> intent_interpreter -> architect -> impact_analysis
+    -> spec_planner -> code_agents -> finalize -> END
+    
+    The intent interpreter, architect and spec planner save their own spec
+    files, so there are no separate save nodes.
     
     Returns:
         Compiled LangGraph workflow
     """
+    # Import agents lazily: they pull in prompts, models and provider SDKs, which
+    # callers that only use the node helpers should not pay for at import time
+    from ..agents.intent_interpreter_agent import IntentInterpreterAgent
+    from ..agents.architect_agent import ArchitectAgent
+    from ..agents.spec_planner_agent import SpecPlannerAgent
+
     # Create checkpointer for state persistence
     checkpointer = MemorySaver()
     
@@ -653,7 +528,6 @@ def create_orchestrator_graph():
             additional_kwargs=intent_config["additional_kwargs"],
         )
     )
-    workflow.add_node("save_intent", save_intent_node)
     workflow.add_node(
         "architect",
         ArchitectAgent(
@@ -662,18 +536,21 @@ def create_orchestrator_graph():
             additional_kwargs=architect_config["additional_kwargs"],
         )
     )
-    workflow.add_node("save_architecture", save_architecture_node)
     workflow.add_node("impact_analysis", impact_analysis_node)  # NEW: Impact analysis
+    spec_planner_agent = SpecPlannerAgent(
+        provider=spec_planner_config["provider"],
+        model=spec_planner_config["model"],
+        additional_kwargs=spec_planner_config["additional_kwargs"],
+    )
+    # Sync runs use __call__; astream/ainvoke use the concurrent async path
     workflow.add_node(
         "spec_planner",
-        SpecPlannerAgent(
-            provider=spec_planner_config["provider"],
-            model=spec_planner_config["model"],
-            additional_kwargs=spec_planner_config["additional_kwargs"],
-        )
+        RunnableLambda(spec_planner_agent, afunc=spec_planner_agent.ainvoke),
+    )
+    workflow.add_node(
+        "code_agents",
+        RunnableLambda(code_agents_wrapper_node, afunc=acode_agents_wrapper_node),
     )
-    workflow.add_node("save_spec_plan", save_spec_plan_node)
-    workflow.add_node("code_agents", code_agents_wrapper_node)
     workflow.add_node("finalize", finalize_node)
     
     # Set entry point
@@ -681,17 +558,24 @@ def create_orchestrator_graph():
     
     # Add edges - deterministic flow
     workflow.add_edge("initialize_graph", "intent_interpreter")
-    workflow.add_edge("intent_interpreter", "save_intent")
-    workflow.add_edge("save_intent", "architect")
-    workflow.add_edge("architect", "save_architecture")
-    workflow.add_edge("save_architecture", "impact_analysis")  # NEW: Add impact analysis
+    workflow.add_edge("intent_interpreter", "architect")
+    workflow.add_edge("architect", "impact_analysis")  # NEW: Add impact analysis
     workflow.add_edge("impact_analysis", "spec_planner")
-    workflow.add_edge("spec_planner", "save_spec_plan")
-    workflow.add_edge("save_spec_plan", "code_agents")
+    workflow.add_edge("spec_planner", "code_agents")
     workflow.add_edge("code_agents", "finalize")
     workflow.add_edge("finalize", END)
     
     # Compile the graph
     compiled = workflow.compile(checkpointer=checkpointer)
     
-    return compiled
\ No newline at end of file
+    return compiled
+
+
+@lru_cache(maxsize=1)
+def get_orchestrator_graph():
+    """Return the orchestrator graph, compiling it on first use.
+    
+    The compiled graph and its MemorySaver are shared across invocations, so
+    state for a thread_id carries over between requests.
+    """
+    return create_orchestrator_graph()
@@ -0,0 +1,114 @@
+#!/bin/bash
+
+# Generated App - Startup Script
+# This script sets up and runs both backend and frontend
+
+set -e  # Exit on error
+
+APP_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
+cd "$APP_DIR"
+
+echo "🚀 Starting App Setup..."
+echo "━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━"
+
+# Step 1: Check Python
+echo ""
+echo "📋 Step 1/4: Checking Python installation..."
+if ! command -v python3 &> /dev/null; then
+    echo "❌ Python 3 is not installed. Please install Python 3.8 or higher."
+    exit 1
+fi
+echo "✅ Python found: $(python3 --version)"
+
+# Step 2: Install dependencies
+echo ""
+echo "📦 Step 2/4: Installing dependencies..."
+if command -v uv &> /dev/null; then
+    echo "Using uv for faster installation..."
+    uv pip install -r requirements.txt
+else
+    echo "Using pip..."
+    pip3 install -r requirements.txt
+fi
+echo "✅ Dependencies installed"
+
+# Step 3: Initialize database
+echo ""
+echo "🗄️  Step 3/4: Initializing database..."
+# Delete existing database if it exists (for fresh initialization)
+DB_PATH="$APP_DIR/app.db"
+if [ -f "$DB_PATH" ]; then
+    echo "Removing existing database..."
+    rm -f "$DB_PATH"
+    echo "✅ Existing database removed"
+fi
+PYTHONPATH="$APP_DIR:$PYTHONPATH" python3 -c "from backend.db.init_db import init_database; init_database(); print('✅ Database initialized')"
+
+# Step 4: Start services
+echo ""
+echo "🚀 Step 4/4: Starting services..."
+echo "━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━"
+echo ""
+echo "Starting Backend API on http://localhost:1234"
+echo "Starting Frontend UI on http://localhost:4321"
+echo ""
+echo "Press Ctrl+C to stop all services"
+echo "━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━"
+echo ""
+
+# Function to cleanup on exit
+cleanup() {
+    echo ""
+    echo "🛑 Stopping services..."
+    kill $BACKEND_PID $FRONTEND_PID 2>/dev/null
+    echo "✅ All services stopped"
+    exit 0
+}
+
+trap cleanup SIGINT SIGTERM
+
+# Start backend
+PYTHONPATH="$APP_DIR:$PYTHONPATH" python3 -m uvicorn backend.main:app --host 0.0.0.0 --port 1234 > backend.log 2>&1 &
+BACKEND_PID=$!
+echo "✅ Backend started (PID: $BACKEND_PID)"
+sleep 3  # Give backend time to start
+
+# Check if backend is actually running
+if ! kill -0 $BACKEND_PID 2>/dev/null; then
+    echo "❌ Backend failed to start. Check backend.log for details:"
+    tail -n 20 backend.log
+    exit 1
+fi
+
+# Start frontend
+PYTHONPATH="$APP_DIR:$PYTHONPATH" streamlit run frontend/app.py > frontend.log 2>&1 &
+FRONTEND_PID=$!
+echo "✅ Frontend started (PID: $FRONTEND_PID)"
+sleep 3  # Give frontend time to start
+
+# Check if frontend is actually running
+if ! kill -0 $FRONTEND_PID 2>/dev/null; then
+    echo "❌ Frontend failed to start. Check frontend.log for details:"
+    tail -n 20 frontend.log
+    kill $BACKEND_PID 2>/dev/null
+    exit 1
+fi
+
+echo ""
+echo "━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━"
+echo "🎉 App is running!"
+echo "━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━"
+echo ""
+echo "📍 Backend API:  http://localhost:1234"
+echo "📍 API Docs:     http://localhost:1234/docs"
+echo "📍 Frontend UI:  http://localhost:4321"
+echo ""
+echo "📝 Logs:"
+echo "   Backend:  tail -f backend.log"
+echo "   Frontend: tail -f frontend.log"
+echo ""
+echo "Press Ctrl+C to stop all services"
+echo "━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━"
+
+# Wait for processes
+wait $BACKEND_PID $FRONTEND_PID
@@ -1,35 +1,58 @@
-"""Pydantic models for tools and responses."""
-
-from .intent_models import (
-    EntityField,
-    PrimaryEntity,
-    UIExpectations,
-    IntentModel,
-    IntentInterpreterResponse,
-)
-from .architect_models import (
-    TechStack,
-    ExecutionLayer,
-    ArchitectResponse,
-)
-from .spec_planner_models import (
-    ModelField,
-    ModelDefinition,
-    BackendModelsSpec,
-    DatabaseTableColumn,
-    DatabaseTable,
-    DatabaseSpec,
-    ServiceFunction,
-    EntityService,
-    BackendServicesSpec,
-    APIEndpoint,
-    RouteDefinition,
-    BackendRoutesSpec,
-    BackendAppBootstrapSpec,
-    PageView,
-    FrontendUISpec,
-)
-from .code_agents import CodeAgentResult
+"""Pydantic models for tools and responses.
+
+Submodules are imported lazily (PEP 562) on first attribute access, so importing
+one model module does not build the schemas of all the others.
+"""
+
+from importlib import import_module
+
+# Exported name -> submodule that defines it
+_LAZY = {
+    "EntityField": "intent_models",
+    "PrimaryEntity": "intent_models",
+    "UIExpectations": "intent_models",
+    "IntentModel": "intent_models",
+    "IntentInterpreterResponse": "intent_models",
+    "INTENT_RESPONSE_VALIDATE": "intent_models",
+    "DEFAULT_ASSUMPTIONS": "intent_models",
+    "FullStack": "architect_models",
+    "BackendOnly": "architect_models",
+    "FrontendOnly": "architect_models",
+    "TechStack": "architect_models",
+    "ExecutionLayer": "architect_models",
+    "ArchitectResponse": "architect_models",
+    "ModelField": "spec_planner_models",
+    "ModelDefinition": "spec_planner_models",
+    "BackendModelsSpec": "spec_planner_models",
+    "DatabaseTableColumn": "spec_planner_models",
+    "DatabaseTable": "spec_planner_models",
+    "DatabaseSpec": "spec_planner_models",
+    "ServiceFunction": "spec_planner_models",
+    "EntityService": "spec_planner_models",
+    "BackendServicesSpec": "spec_planner_models",
+    "APIEndpoint": "spec_planner_models",
+    "RouteDefinition": "spec_planner_models",
+    "BackendRoutesSpec": "spec_planner_models",
+    "BackendAppBootstrapSpec": "spec_planner_models",
+    "PageView": "spec_planner_models",
+    "FrontendUISpec": "spec_planner_models",
+    "CodeAgentResult": "code_agents",
+}
+
+
+def __getattr__(name: str):
+    try:
+        module_name = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(import_module(f".{module_name}", __name__), name)
+    globals()[name] = value  # Cache so later lookups bypass __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(__all__)
+
 
 __all__ = [
     "EntityField",
@@ -37,6 +60,11 @@ __all__ = [
     "UIExpectations",
     "IntentModel",
     "IntentInterpreterResponse",
+    "INTENT_RESPONSE_VALIDATE",
+    "DEFAULT_ASSUMPTIONS",
+    "FullStack",
+    "BackendOnly",
+    "FrontendOnly",
     "TechStack",
     "ExecutionLayer",
     "ArchitectResponse",
@@ -57,4 +85,3 @@ __all__ = [
     "FrontendUISpec",
     "CodeAgentResult",
 ]
-
@@ -1,45 +1,94 @@
 """Pydantic models for Architect Agent."""
 
-from pydantic import BaseModel, Field, field_validator
-from typing import Literal, List, Dict, Any, Optional
+from __future__ import annotations
+
+import sys
+from collections import deque
+
+from pydantic import (
+    AfterValidator,
+    BaseModel,
+    ConfigDict,
+    Field,
+    PlainSerializer,
+    StringConstraints,
+    WithJsonSchema,
+    field_validator,
+)
+from typing import Annotated, Literal, Any, Union
 
 # Constants for validation
 ALLOWED_LAYER_TYPES = Literal["code_generation"]
 ALLOWED_BACKEND_TECHS = Literal["fastapi"]
 ALLOWED_FRONTEND_TECHS = Literal["streamlit"]
 
+# Layer IDs are stripped, non-empty and contain no whitespace; checked by
+# pydantic-core instead of a Python validator
+LayerId = Annotated[str, StringConstraints(strip_whitespace=True, min_length=1, pattern=r"^\S+$")]
+
+# Generator IDs and paths repeat across layers and runs; interning keeps one
+# copy of each distinct value and lets equality checks short-circuit on identity
+InternedStr = Annotated[str, AfterValidator(sys.intern)]
+
+# Layer dependencies are deduplicated on input and give O(1) membership tests.
+# They still dump (and appear in the LLM schema) as a plain list of IDs, sorted
+# so the output is deterministic.
+LayerDependencies = Annotated[
+    frozenset[str],
+    PlainSerializer(sorted, return_type=list[str]),
+    WithJsonSchema({"type": "array", "items": {"type": "string"}}),
+]
+
 
-class TechStack(BaseModel):
-    """Technology stack selection for the application.
+_BACKEND_DESCRIPTION = "Backend framework to use. Set to 'fastapi' when the application needs server-side logic, APIs, data storage/retrieval, or data processing. IMPORTANT: Read-only data still requires a backend. Set to None ONLY when no data storage or processing is needed."
+_FRONTEND_DESCRIPTION = "Frontend framework to use. Set to 'streamlit' when the application needs a user interface. Set to None when no UI is required."
+
+
+class FullStack(BaseModel):
+    """Full-stack application: server-side logic/data AND a user interface."""
     
-    Select technologies based on what components the application needs:
-    - Set backend when the application has server-side logic, APIs, or data processing
-    - Set frontend when the application has a user interface
-    - Both can be set for full-stack applications
-    - Either can be None if that component is not required
-    - At least one must be specified
-    """
+    model_config = ConfigDict(defer_build=True)
     
-    backend: Optional[ALLOWED_BACKEND_TECHS] = Field(
-        default=None,
-        description="Backend framework to use. Set to 'fastapi' when the application needs server-side logic, APIs, data storage/retrieval, or data processing. IMPORTANT: Read-only data still requires a backend. Set to None ONLY when no data storage or processing is needed."
-    )
-    frontend: Optional[ALLOWED_FRONTEND_TECHS] = Field(
-        default=None,
-        description="Frontend framework to use. Set to 'streamlit' when the application needs a user interface. Set to None when no UI is required."
-    )
+    backend: ALLOWED_BACKEND_TECHS = Field(description=_BACKEND_DESCRIPTION)
+    frontend: ALLOWED_FRONTEND_TECHS = Field(description=_FRONTEND_DESCRIPTION)
+
+
+class BackendOnly(BaseModel):
+    """Backend-only application: server-side logic/data, no user interface."""
     
-    @field_validator('frontend')
-    @classmethod
-    def validate_at_least_one_component(cls, v: Optional[str], info) -> Optional[str]:
-        """Ensure at least one of backend or frontend is specified."""
-        backend = info.data.get('backend')
-        if backend is None and v is None:
-            raise ValueError(
-                "At least one of backend or frontend must be specified. "
-                "An application needs either backend logic or a user interface (or both)."
-            )
-        return v
+    model_config = ConfigDict(defer_build=True)
+    
+    backend: ALLOWED_BACKEND_TECHS = Field(description=_BACKEND_DESCRIPTION)
+    frontend: None = Field(default=None, description=_FRONTEND_DESCRIPTION)
+
+
+class FrontendOnly(BaseModel):
+    """Frontend-only application: a user interface with no data persistence."""
+    
+    model_config = ConfigDict(defer_build=True)
+    
+    backend: None = Field(default=None, description=_BACKEND_DESCRIPTION)
+    frontend: ALLOWED_FRONTEND_TECHS = Field(description=_FRONTEND_DESCRIPTION)
+
+
+# Technology stack selection for the application. A Union alias has no docstring
+# of its own, so the selection guidance the LLM needs lives in
+# _TECH_STACK_DESCRIPTION, the description of ArchitectResponse.tech_stack.
+#
+# The "at least one" rule is encoded by the union itself: no variant accepts
+# backend=None together with frontend=None, so pydantic-core rejects it without
+# a Python validator. Every variant dumps to the same {"backend", "frontend"} shape.
+TechStack = Union[FullStack, BackendOnly, FrontendOnly]
+
+_TECH_STACK_DESCRIPTION = (
+    "Selected technology stack for the application. "
+    "Select technologies based on what components the application needs: "
+    "set backend when the application has server-side logic, APIs, or data processing; "
+    "set frontend when the application has a user interface; "
+    "both can be set for full-stack applications; "
+    "either can be None if that component is not required; "
+    "at least one must be specified."
+)
 
 
 class ExecutionLayer(BaseModel):
@@ -75,7 +124,9 @@ class ExecutionLayer(BaseModel):
     Include only the layers and technologies that the intent requires.
     """
     
-    id: str = Field(
+    model_config = ConfigDict(frozen=True, defer_build=True)
+    
+    id: LayerId = Field(
         description=(
             "Stable, descriptive identifier for this layer (primary orchestration key). "
             "Use clear, conventional names like 'backend_models', 'backend_services', "
@@ -87,20 +138,20 @@ class ExecutionLayer(BaseModel):
         default="code_generation",
         description="Layer category - always set to 'code_generation' for all layers in MVP"
     )
-    generator: str = Field(
+    generator: InternedStr = Field(
         description=(
             "Agent ID selected from the agent registry. "
             "Must match an agent_id in the provided registry."
         )
     )
-    path: str = Field(
+    path: InternedStr = Field(
         description=(
             "Filesystem root owned by this layer. "
             "Relative path from the app root (e.g., 'backend/models', 'frontend')."
         )
     )
-    depends_on: List[str] = Field(
-        default_factory=list,
+    depends_on: LayerDependencies = Field(
+        default_factory=frozenset,
         description=(
             "List of MINIMAL upstream layer IDs that this layer DIRECTLY depends on. "
             "Only declare dependencies for what this layer directly imports. "
@@ -108,39 +159,45 @@ class ExecutionLayer(BaseModel):
             "DO NOT over-declare transitive dependencies."
         )
     )
+
+
+def _topological_order(layers: list[ExecutionLayer]) -> list[str]:
+    """Order layer IDs with Kahn's algorithm.
     
-    @field_validator('id')
-    @classmethod
-    def validate_id_format(cls, v: str) -> str:
-        """Ensure ID is a valid identifier."""
-        if not v or not v.strip():
-            raise ValueError("Layer ID cannot be empty")
-        if ' ' in v:
-            raise ValueError("Layer ID cannot contain spaces")
-        return v.strip()
-    
-    @field_validator('depends_on')
-    @classmethod
-    def validate_no_self_dependency(cls, v: List[str], info) -> List[str]:
-        """Ensure layer doesn't depend on itself."""
-        if hasattr(info, 'data') and 'id' in info.data:
-            layer_id = info.data['id']
-            if layer_id in v:
-                raise ValueError(f"Layer '{layer_id}' cannot depend on itself")
-        return v
+    Layers on (or behind) a dependency cycle are never reached, so the result
+    is shorter than `layers` exactly when the dependencies contain a cycle.
+    Dependencies must reference IDs present in `layers`.
+    """
+    indegree = {}
+    dependents = {layer.id: [] for layer in layers}
+    for layer in layers:
+        indegree[layer.id] = len(layer.depends_on)
+        for dep in layer.depends_on:
+            dependents[dep].append(layer.id)
+    
+    ready = deque(layer_id for layer_id, count in indegree.items() if count == 0)
+    order = []
+    while ready:
+        layer_id = ready.popleft()
+        order.append(layer_id)
+        for dependent in dependents[layer_id]:
+            indegree[dependent] -= 1
+            if indegree[dependent] == 0:
+                ready.append(dependent)
+    return order
 
 
 class ArchitectResponse(BaseModel):
     """Response model for Architect Agent."""
     
+    model_config = ConfigDict(defer_build=True)
+    
     architecture_version: str = Field(
         default="1.0",
         description="Version of the architecture schema"
     )
-    tech_stack: TechStack = Field(
-        description="Selected technology stack for the application"
-    )
-    execution_layers: List[ExecutionLayer] = Field(
+    tech_stack: TechStack = Field(description=_TECH_STACK_DESCRIPTION)
+    execution_layers: list[ExecutionLayer] = Field(
         description=(
             "List of execution layers defining the architecture. "
             "Each layer maps to a generator agent and declares dependencies."
@@ -149,35 +206,45 @@ class ArchitectResponse(BaseModel):
     
     @field_validator('execution_layers')
     @classmethod
-    def validate_layers(cls, v: List[ExecutionLayer]) -> List[ExecutionLayer]:
+    def validate_layers(cls, v: list[ExecutionLayer]) -> list[ExecutionLayer]:
         """Validate execution layers for basic correctness."""
         if not v:
             raise ValueError("At least one execution layer is required")
         
-        # Check for duplicate IDs
-        layer_ids = [layer.id for layer in v]
-        if len(layer_ids) != len(set(layer_ids)):
-            duplicates = [lid for lid in layer_ids if layer_ids.count(lid) > 1]
+        # Check for duplicate IDs in one pass
+        layer_ids = set()
+        duplicates = set()
+        for layer in v:
+            if layer.id in layer_ids:
+                duplicates.add(layer.id)
+            layer_ids.add(layer.id)
+        if duplicates:
             raise ValueError(
-                f"Duplicate layer IDs found: {set(duplicates)}. "
+                f"Duplicate layer IDs found: {duplicates}. "
                 f"Each layer must have a unique ID."
             )
         
         # Validate dependencies reference existing layers
-        all_layer_ids = set(layer_ids)
         for layer in v:
-            invalid_deps = set(layer.depends_on) - all_layer_ids
+            invalid_deps = layer.depends_on - layer_ids
             if invalid_deps:
                 raise ValueError(
-                    f"Layer '{layer.id}' has invalid dependencies: {invalid_deps}. "
+                    f"Layer '{layer.id}' has invalid dependencies: {sorted(invalid_deps)}. "
                     f"All dependencies must reference existing layer IDs."
                 )
-        
-        # Check for circular dependencies (basic check)
-        for layer in v:
             if layer.id in layer.depends_on:
                 raise ValueError(
                     f"Layer '{layer.id}' cannot depend on itself"
                 )
         
+        # Check for circular dependencies (including transitive ones such as
+        # A -> B -> A): layers the topological sort never reaches form a cycle
+        order = _topological_order(v)
+        if len(order) < len(v):
+            cyclic = sorted(layer_ids.difference(order))
+            raise ValueError(
+                f"Circular dependencies found between layers: {cyclic}. "
+                f"Layer dependencies must form a directed acyclic graph."
+            )
+        
         return v
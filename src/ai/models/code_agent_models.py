@@ -1,7 +1,9 @@
 """Pydantic models and TypedDicts for Code Generation Agents."""
 
-from typing import TypedDict, List, Dict, Any
-from pydantic import BaseModel, Field
+from __future__ import annotations
+
+from typing import TypedDict, Any
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class CodeAgentResult(TypedDict):
@@ -12,9 +14,9 @@ class CodeAgentResult(TypedDict):
     - Deterministic retries
     - Selective regeneration
     """
-    generated_files: List[str]  # List of file paths relative to app root (e.g., ["backend/models/task.py"])
-    warnings: List[str]  # List of warning messages (e.g., ["Model X uses deprecated field Y"])
-    metadata: Dict[str, Any]  # Additional metadata (e.g., {"models_created": 3, "total_lines": 150})
+    generated_files: list[str]  # List of file paths relative to app root (e.g., ["backend/models/task.py"])
+    warnings: list[str]  # List of warning messages (e.g., ["Model X uses deprecated field Y"])
+    metadata: dict[str, Any]  # Additional metadata (e.g., {"models_created": 3, "total_lines": 150})
 
 
 class CodeAgentResponse(BaseModel):
@@ -24,15 +26,16 @@ class CodeAgentResponse(BaseModel):
     The LLM returns code content as a dict (filename -> code), which is then
     converted to CodeAgentResult format (list of file paths).
     """
-    files: Dict[str, str] = Field(
+    model_config = ConfigDict(defer_build=True)
+    files: dict[str, str] = Field(
         ...,
         description="Dictionary mapping filename to complete Python code content. Key is the filename (e.g., 'task.py'), value is the complete Python code as a string."
     )
-    warnings: List[str] = Field(
+    warnings: list[str] = Field(
         default_factory=list,
         description="List of warning messages generated during code generation (e.g., ['Model X uses deprecated pattern Y', 'Field Z may need validation'])"
     )
-    metadata: Dict[str, Any] = Field(
+    metadata: dict[str, Any] = Field(
         default_factory=dict,
         description="Additional metadata about the code generation process. Common keys include: models_created (number of model classes), entities_covered (list of entity names), total_lines (approximate line count), etc."
     )
@@ -1,33 +1,43 @@
-"""Code agent models."""
-
-from .code_agent_models import (
-    CodeAgentResult,
-    GeneratedFile,
-)
-from .backend_model_agent_models import (
-    BackendModelAgentResponse,
-    BackendModelAgentMetadata,
-)
-from .backend_service_agent_models import (
-    BackendServiceAgentResponse,
-    BackendServiceAgentMetadata,
-)
-from .database_agent_models import (
-    DatabaseAgentResponse,
-    DatabaseAgentMetadata,
-)
-from .backend_router_agent_models import (
-    BackendRouterAgentResponse,
-    BackendRouterAgentMetadata,
-)
-from .backend_app_agent_models import (
-    BackendAppAgentResponse,
-    BackendAppAgentMetadata,
-)
-from .frontend_agent_models import (
-    FrontendAgentResponse,
-    FrontendAgentMetadata,
-)
+"""Code agent models.
+
+Submodules are imported lazily (PEP 562) on first attribute access, so only the
+models a run actually uses build their Pydantic schemas.
+"""
+
+from importlib import import_module
+
+# Exported name -> submodule that defines it
+_LAZY = {
+    "CodeAgentResult": "code_agent_models",
+    "GeneratedFile": "code_agent_models",
+    "BackendModelAgentResponse": "backend_model_agent_models",
+    "BackendModelAgentMetadata": "backend_model_agent_models",
+    "BackendServiceAgentResponse": "backend_service_agent_models",
+    "BackendServiceAgentMetadata": "backend_service_agent_models",
+    "DatabaseAgentResponse": "database_agent_models",
+    "DatabaseAgentMetadata": "database_agent_models",
+    "BackendRouterAgentResponse": "backend_router_agent_models",
+    "BackendRouterAgentMetadata": "backend_router_agent_models",
+    "BackendAppAgentResponse": "backend_app_agent_models",
+    "BackendAppAgentMetadata": "backend_app_agent_models",
+    "FrontendAgentResponse": "frontend_agent_models",
+    "FrontendAgentMetadata": "frontend_agent_models",
+}
+
+
+def __getattr__(name: str):
+    try:
+        module_name = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(import_module(f".{module_name}", __name__), name)
+    globals()[name] = value  # Cache so later lookups bypass __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(__all__)
+
 
 __all__ = [
     "CodeAgentResult",
@@ -1,13 +1,22 @@
 """Pydantic models for Backend App Agent."""
 
-from typing import List, Optional
-from pydantic import BaseModel, Field
+from __future__ import annotations
 
-from .code_agent_models import GeneratedFile
+from typing import Optional
+from pydantic import BaseModel, ConfigDict, Field
+
+from .code_agent_models import (
+    GeneratedFile,
+    FILES_DESCRIPTION,
+    TOTAL_LINES_DESCRIPTION,
+    CONSTRAINTS_RESPECTED_DESCRIPTION,
+    ASSUMPTIONS_MADE_DESCRIPTION,
+)
 
 
 class BackendAppAgentMetadata(BaseModel):
     """Metadata specific to Backend App Agent."""
+    model_config = ConfigDict(frozen=True, defer_build=True)
     app_created: Optional[bool] = Field(
         None,
         description="Whether the app bootstrap file was created"
@@ -18,30 +27,31 @@ class BackendAppAgentMetadata(BaseModel):
     )
     total_lines: Optional[int] = Field(
         None,
-        description="Approximate total lines of code generated"
+        description=TOTAL_LINES_DESCRIPTION
     )
-    middleware_configured: Optional[List[str]] = Field(
+    middleware_configured: Optional[tuple[str, ...]] = Field(
         None,
         description="List of middleware configured (if any)"
     )
     constraints_respected: Optional[bool] = Field(
         None,
-        description="Boolean indicating whether all layer constraints were followed"
+        description=CONSTRAINTS_RESPECTED_DESCRIPTION
     )
-    assumptions_made: Optional[List[str]] = Field(
+    assumptions_made: Optional[tuple[str, ...]] = Field(
         None,
-        description="List of assumptions made when spec was ambiguous"
+        description=ASSUMPTIONS_MADE_DESCRIPTION
     )
 
 
 class BackendAppAgentResponse(BaseModel):
     """Pydantic model for Backend App Agent LLM structured output."""
-    files: List[GeneratedFile] = Field(
+    model_config = ConfigDict(defer_build=True)
+    files: list[GeneratedFile] = Field(
         ...,
-        description="List of generated files, each containing filename and code_content"
+        description=FILES_DESCRIPTION
     )
-    warnings: List[str] = Field(
-        default_factory=list,
+    warnings: tuple[str, ...] = Field(
+        default=(),
         description=(
             "List of warning messages generated during code generation. "
             "IMPORTANT: Always emit warnings for potential issues like: "
@@ -1,30 +1,38 @@
 """Pydantic models for Backend Model Agent."""
 
-from typing import List, Optional
-from pydantic import BaseModel, Field
+from __future__ import annotations
 
-from .code_agent_models import GeneratedFile
+from typing import Optional
+from pydantic import BaseModel, ConfigDict, Field
+
+from .code_agent_models import (
+    GeneratedFile,
+    FILES_DESCRIPTION,
+    ENTITIES_COVERED_DESCRIPTION,
+    TOTAL_LINES_DESCRIPTION,
+)
 
 
 class BackendModelAgentMetadata(BaseModel):
     """Metadata specific to Backend Model Agent."""
+    model_config = ConfigDict(frozen=True, defer_build=True)
     models_created: Optional[int] = Field(
         None,
         description="Number of model classes generated"
     )
-    entities_covered: Optional[List[str]] = Field(
+    entities_covered: Optional[tuple[str, ...]] = Field(
         None,
-        description="List of entity names that were processed"
+        description=ENTITIES_COVERED_DESCRIPTION
     )
     total_lines: Optional[int] = Field(
         None,
-        description="Approximate total lines of code generated"
+        description=TOTAL_LINES_DESCRIPTION
     )
     constraints_respected: Optional[bool] = Field(
         None,
         description="Boolean indicating whether all layer constraints were followed (e.g., no id fields, extra='forbid' on input models)"
     )
-    assumptions_made: Optional[List[str]] = Field(
+    assumptions_made: Optional[tuple[str, ...]] = Field(
         None,
         description="List of assumptions made when spec was ambiguous (e.g., ['Assumed status defaults to pending'])"
     )
@@ -32,12 +40,13 @@ class BackendModelAgentMetadata(BaseModel):
 
 class BackendModelAgentResponse(BaseModel):
     """Pydantic model for Backend Model Agent LLM structured output."""
-    files: List[GeneratedFile] = Field(
+    model_config = ConfigDict(defer_build=True)
+    files: list[GeneratedFile] = Field(
         ...,
-        description="List of generated files, each containing filename and code_content"
+        description=FILES_DESCRIPTION
     )
-    warnings: List[str] = Field(
-        default_factory=list,
+    warnings: tuple[str, ...] = Field(
+        default=(),
         description=(
             "List of warning messages generated during code generation. "
             "IMPORTANT: Always emit warnings for potential issues like: "
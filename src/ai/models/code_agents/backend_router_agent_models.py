@@ -1,13 +1,23 @@
 """Pydantic models for Backend Router Agent."""
 
-from typing import List, Dict, Optional
-from pydantic import BaseModel, Field
+from __future__ import annotations
 
-from .code_agent_models import GeneratedFile
+from typing import Optional
+from pydantic import BaseModel, ConfigDict, Field
+
+from .code_agent_models import (
+    GeneratedFile,
+    FILES_DESCRIPTION,
+    ENTITIES_COVERED_DESCRIPTION,
+    TOTAL_LINES_DESCRIPTION,
+    CONSTRAINTS_RESPECTED_DESCRIPTION,
+    ASSUMPTIONS_MADE_DESCRIPTION,
+)
 
 
 class BackendRouterAgentMetadata(BaseModel):
     """Metadata specific to Backend Router Agent."""
+    model_config = ConfigDict(frozen=True, defer_build=True)
     routers_created: Optional[int] = Field(
         None,
         description="Number of router files generated"
@@ -16,32 +26,33 @@ class BackendRouterAgentMetadata(BaseModel):
         None,
         description="Total number of routes generated"
     )
-    entities_covered: Optional[List[str]] = Field(
+    entities_covered: Optional[tuple[str, ...]] = Field(
         None,
-        description="List of entity names that were processed"
+        description=ENTITIES_COVERED_DESCRIPTION
     )
     total_lines: Optional[int] = Field(
         None,
-        description="Approximate total lines of code generated"
+        description=TOTAL_LINES_DESCRIPTION
     )
     constraints_respected: Optional[bool] = Field(
         None,
-        description="Boolean indicating whether all layer constraints were followed"
+        description=CONSTRAINTS_RESPECTED_DESCRIPTION
     )
-    assumptions_made: Optional[List[str]] = Field(
+    assumptions_made: Optional[tuple[str, ...]] = Field(
         None,
-        description="List of assumptions made when spec was ambiguous"
+        description=ASSUMPTIONS_MADE_DESCRIPTION
     )
 
 
 class BackendRouterAgentResponse(BaseModel):
     """Pydantic model for Backend Router Agent LLM structured output."""
-    files: List[GeneratedFile] = Field(
+    model_config = ConfigDict(defer_build=True)
+    files: list[GeneratedFile] = Field(
         ...,
-        description="List of generated files, each containing filename and code_content"
+        description=FILES_DESCRIPTION
     )
-    warnings: List[str] = Field(
-        default_factory=list,
+    warnings: tuple[str, ...] = Field(
+        default=(),
         description=(
             "List of warning messages generated during code generation. "
             "IMPORTANT: Always emit warnings for potential issues like: "
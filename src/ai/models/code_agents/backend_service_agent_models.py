@@ -1,47 +1,57 @@
 """Pydantic models for Backend Service Agent."""
 
-from typing import List, Dict, Optional
-from pydantic import BaseModel, Field
+from __future__ import annotations
 
-from .code_agent_models import GeneratedFile
+from typing import Annotated, Optional, TypedDict
+from pydantic import BaseModel, ConfigDict, Field, with_config
 
+from .code_agent_models import (
+    GeneratedFile,
+    FILES_DESCRIPTION,
+    ENTITIES_COVERED_DESCRIPTION,
+    TOTAL_LINES_DESCRIPTION,
+    CONSTRAINTS_RESPECTED_DESCRIPTION,
+)
 
-class BackendServiceAgentMetadata(BaseModel):
+
+@with_config(ConfigDict(defer_build=True))
+class BackendServiceAgentMetadata(TypedDict, total=False):
     """Metadata specific to Backend Service Agent."""
-    services_created: Optional[int] = Field(
-        None,
-        description="Number of service classes generated"
-    )
-    entities_covered: Optional[List[str]] = Field(
-        None,
-        description="List of entity names that were processed"
-    )
-    total_lines: Optional[int] = Field(
-        None,
-        description="Approximate total lines of code generated"
-    )
-    functions_created: Optional[int] = Field(
-        None,
-        description="Total number of service functions generated"
-    )
-    constraints_respected: Optional[bool] = Field(
-        None,
-        description="Boolean indicating whether all layer constraints were followed"
-    )
-    assumptions_made: Optional[List[str]] = Field(
-        None,
-        description="List of assumptions made when spec was ambiguous (e.g., ['Assumed task_id is int type'])"
-    )
+    services_created: Annotated[
+        Optional[int],
+        Field(description="Number of service classes generated"),
+    ]
+    entities_covered: Annotated[
+        Optional[tuple[str, ...]],
+        Field(description=ENTITIES_COVERED_DESCRIPTION),
+    ]
+    total_lines: Annotated[
+        Optional[int],
+        Field(description=TOTAL_LINES_DESCRIPTION),
+    ]
+    functions_created: Annotated[
+        Optional[int],
+        Field(description="Total number of service functions generated"),
+    ]
+    constraints_respected: Annotated[
+        Optional[bool],
+        Field(description=CONSTRAINTS_RESPECTED_DESCRIPTION),
+    ]
+    assumptions_made: Annotated[
+        Optional[tuple[str, ...]],
+        Field(description="List of assumptions made when spec was ambiguous (e.g., ['Assumed task_id is int type'])"),
+    ]
 
 
 class BackendServiceAgentResponse(BaseModel):
     """Pydantic model for Backend Service Agent LLM structured output."""
-    files: List[GeneratedFile] = Field(
+    model_config = ConfigDict(defer_build=True)
+    files: list[GeneratedFile] = Field(
         ...,
-        description="List of generated files, each containing filename and code_content"
+        description=FILES_DESCRIPTION
     )
-    warnings: List[str] = Field(
-        default_factory=list,
+    warnings: tuple[str, ...] = Field(
+        default=(),
         description=(
             "List of warning messages generated during code generation. "
             "IMPORTANT: Always emit warnings for potential issues like: "
@@ -53,7 +63,7 @@ class BackendServiceAgentResponse(BaseModel):
         )
     )
     metadata: BackendServiceAgentMetadata = Field(
-        default_factory=BackendServiceAgentMetadata,
+        default_factory=dict,
         description=(
             "Metadata about the code generation process. "
             "All fields are optional: "
@@ -64,3 +74,4 @@ class BackendServiceAgentResponse(BaseModel):
             "Provide these fields when available."
         )
     )
+
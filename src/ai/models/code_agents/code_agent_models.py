@@ -1,7 +1,16 @@
 """Shared models and TypedDicts for Code Generation Agents."""
 
-from typing import TypedDict, List, Dict, Any
-from pydantic import BaseModel, Field
+from __future__ import annotations
+
+from typing import TypedDict, Any
+from pydantic import BaseModel, ConfigDict, Field
+
+# Field descriptions shared by the per-agent response and metadata models
+FILES_DESCRIPTION = "List of generated files, each containing filename and code_content"
+ENTITIES_COVERED_DESCRIPTION = "List of entity names that were processed"
+TOTAL_LINES_DESCRIPTION = "Approximate total lines of code generated"
+CONSTRAINTS_RESPECTED_DESCRIPTION = "Boolean indicating whether all layer constraints were followed"
+ASSUMPTIONS_MADE_DESCRIPTION = "List of assumptions made when spec was ambiguous"
 
 
 class CodeAgentResult(TypedDict):
@@ -12,13 +21,14 @@ class CodeAgentResult(TypedDict):
     - Deterministic retries
     - Selective regeneration
     """
-    generated_files: List[str]  # List of file paths relative to app root (e.g., ["backend/models/task.py"])
-    warnings: List[str]  # List of warning messages (e.g., ["Model X uses deprecated field Y"])
-    metadata: Dict[str, Any]  # Additional metadata (e.g., {"models_created": 3, "total_lines": 150})
+    generated_files: list[str]  # List of file paths relative to app root (e.g., ["backend/models/task.py"])
+    warnings: list[str]  # List of warning messages (e.g., ["Model X uses deprecated field Y"])
+    metadata: dict[str, Any]  # Additional metadata (e.g., {"models_created": 3, "total_lines": 150})
 
 
 class GeneratedFile(BaseModel):
     """Represents a single generated code file."""
+    model_config = ConfigDict(defer_build=True)
     filename: str = Field(
         ...,
         description="The filename of the generated file (e.g., 'task.py', 'user.py') - use snake_case naming"
@@ -33,15 +43,15 @@ class GeneratedFile(BaseModel):
             "Do NOT include id fields or non-functional metadata like read_only=True."
         )
     )
-    imports: List[str] = Field(
+    imports: list[str] = Field(
         default_factory=list,
         description="List of symbols imported from OTHER PROJECT FILES (e.g., ['TaskCreate', 'TaskUpdate']). Do NOT include external library imports here - those go in dependencies. These must also appear in the file's import statements."
     )
-    exports: List[str] = Field(
+    exports: list[str] = Field(
         default_factory=list,
         description="List of symbols defined in this file that other files can import (e.g., ['Task', 'TaskCreate', 'TaskUpdate'])."
     )
-    dependencies: List[str] = Field(
+    dependencies: list[str] = Field(
         default_factory=list,
         description="List of external Python packages needed to run this file (e.g., ['pydantic', 'fastapi']). Only include third-party libraries, NOT standard library modules or internal project files."
     )
@@ -56,52 +66,27 @@ class GeneratedFile(BaseModel):
     )
 
 
-class ManifestFile(BaseModel):
+class ManifestFile(TypedDict):
+    """Manifest entry for one generated file.
+    
+    Plain TypedDict rather than a BaseModel: it is built from an already
+    validated GeneratedFile and only ever stored in state, so validating it
+    again would be wasted work.
+    """
+    file_path: str  # Path to the file relative to the app root
+    imports: list[str]  # Symbols imported from other project files
+    exports: list[str]  # Symbols defined in this file that other files can import
+    dependencies: list[str]  # External Python packages needed to run this file
+    summary: str  # Brief summary of the file's role and functionality
 
-    file_path: str = Field(
-        ...,
-        description="The path to the file relative to the app root."
-    )
-    imports: List[str] = Field(
-        default_factory=list,
-        description="List of symbols imported from OTHER PROJECT FILES (e.g., ['TaskCreate', 'TaskUpdate']). Do NOT include external library imports here - those go in dependencies. These must also appear in the file's import statements."
-    )
-    exports: List[str] = Field(
-        default_factory=list,
-        description="List of symbols defined in this file that other files can import (e.g., ['Task', 'TaskCreate', 'TaskUpdate'])."
-    )
-    dependencies: List[str] = Field(
-        default_factory=list,
-        description="List of external Python packages needed to run this file (e.g., ['pydantic', 'fastapi']). Only include third-party libraries, NOT standard library modules or internal project files."
-    )
-    summary: str = Field(
-        ...,
-        description=(
-            "Brief summary of the file's role and functionality. Include: "
-            "main purpose, key functions/classes defined, their responsibilities, "
-            "critical parameters/arguments, and return types. Keep it concise "
-            "but informative enough for other agents to understand how to use this module."
-        )
-    )
 
-class Manifest(BaseModel):
+class Manifest(TypedDict):
+    """Manifest of everything one layer generated."""
+    layer_id: str  # ID of the layer that generated this manifest
+    spec: dict[str, Any]  # Spec of the layer
+    manifest_files: list[ManifestFile]  # Files generated by the layer
 
-    layer_id: str = Field(
-        ...,
-        description="The ID of the layer that generated this manifest."
-    )
-    spec: Dict[str, Any] = Field(
-        ...,
-        description="The spec of the layer."
-    )
-    manifest_files: List[ManifestFile] = Field(
-        ...,
-        description="The list of files generated by the layer."
-    )
 
-class Manifests(BaseModel):
-    manifests: List[Manifest] = Field(
-        ...,
-        description="The list of manifests."
-    )
-    
\ No newline at end of file
+class Manifests(TypedDict):
+    manifests: list[Manifest]
+
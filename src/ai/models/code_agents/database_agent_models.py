@@ -1,47 +1,57 @@
 """Pydantic models for Database Agent."""
 
-from typing import List, Optional
-from pydantic import BaseModel, Field
+from __future__ import annotations
 
-from .code_agent_models import GeneratedFile
+from typing import Annotated, Optional, TypedDict
+from pydantic import BaseModel, ConfigDict, Field, with_config
 
+from .code_agent_models import (
+    GeneratedFile,
+    FILES_DESCRIPTION,
+    ENTITIES_COVERED_DESCRIPTION,
+    TOTAL_LINES_DESCRIPTION,
+    ASSUMPTIONS_MADE_DESCRIPTION,
+)
 
-class DatabaseAgentMetadata(BaseModel):
+
+@with_config(ConfigDict(defer_build=True))
+class DatabaseAgentMetadata(TypedDict, total=False):
     """Metadata specific to Database Agent."""
-    tables_created: Optional[int] = Field(
-        None,
-        description="Number of database tables created"
-    )
-    repositories_created: Optional[int] = Field(
-        None,
-        description="Number of repository classes generated"
-    )
-    entities_covered: Optional[List[str]] = Field(
-        None,
-        description="List of entity names that were processed"
-    )
-    total_lines: Optional[int] = Field(
-        None,
-        description="Approximate total lines of code generated"
-    )
-    constraints_respected: Optional[bool] = Field(
-        None,
-        description="Boolean indicating whether all layer constraints were followed (e.g., SQLite only, no migration engine)"
-    )
-    assumptions_made: Optional[List[str]] = Field(
-        None,
-        description="List of assumptions made when spec was ambiguous"
-    )
+    tables_created: Annotated[
+        Optional[int],
+        Field(description="Number of database tables created"),
+    ]
+    repositories_created: Annotated[
+        Optional[int],
+        Field(description="Number of repository classes generated"),
+    ]
+    entities_covered: Annotated[
+        Optional[tuple[str, ...]],
+        Field(description=ENTITIES_COVERED_DESCRIPTION),
+    ]
+    total_lines: Annotated[
+        Optional[int],
+        Field(description=TOTAL_LINES_DESCRIPTION),
+    ]
+    constraints_respected: Annotated[
+        Optional[bool],
+        Field(description="Boolean indicating whether all layer constraints were followed (e.g., SQLite only, no migration engine)"),
+    ]
+    assumptions_made: Annotated[
+        Optional[tuple[str, ...]],
+        Field(description=ASSUMPTIONS_MADE_DESCRIPTION),
+    ]
 
 
 class DatabaseAgentResponse(BaseModel):
     """Pydantic model for Database Agent LLM structured output."""
-    files: List[GeneratedFile] = Field(
+    model_config = ConfigDict(defer_build=True)
+    files: list[GeneratedFile] = Field(
         ...,
-        description="List of generated files, each containing filename and code_content"
+        description=FILES_DESCRIPTION
     )
-    warnings: List[str] = Field(
-        default_factory=list,
+    warnings: tuple[str, ...] = Field(
+        default=(),
         description=(
             "List of warning messages generated during code generation. "
             "IMPORTANT: Always emit warnings for potential issues like: "
@@ -51,7 +61,7 @@ class DatabaseAgentResponse(BaseModel):
         )
     )
     metadata: DatabaseAgentMetadata = Field(
-        default_factory=DatabaseAgentMetadata,
+        default_factory=dict,
         description=(
             "Metadata about the code generation process. "
             "All fields are optional: "
@@ -59,3 +69,4 @@ class DatabaseAgentResponse(BaseModel):
             "Provide these fields when available."
         )
     )
+
@@ -1,15 +1,31 @@
 """Pydantic models for Intent Interpreter."""
 
-from pydantic import BaseModel, Field, field_validator, model_validator
-from typing import Literal, Optional, Dict, List
+import sys
+
+from pydantic import BaseModel, ConfigDict, Field, StringConstraints, WithJsonSchema, field_validator, model_validator
+from typing import Annotated, Final, Literal, Optional, List, Tuple
 
 # Constants for validation
 ALLOWED_FIELD_TYPES = Literal["string", "integer", "boolean", "date"]
-ALLOWED_CRUD_OPERATIONS = Literal["create", "read", "update", "delete"]
 ALLOWED_UI_COMPLEXITY = Literal["basic", "intermediate", "advanced", "no_ui"]
 ALLOWED_INTERACTION_STYLES = Literal["form_and_list", "dashboard", "wizard", "single_page", "no_ui"]
 ALLOWED_APP_CATEGORIES = Literal["crud_app", "dashboard", "form_app", "api_service", "other"]
 
+# Natural-language entity description; checked by pydantic-core, not a Python validator
+EntityDescription = Annotated[str, StringConstraints(strip_whitespace=True, min_length=10)]
+
+# One bit per CRUD verb, for allocation-free validity and duplicate checks
+_VERB_BIT = {"create": 1, "read": 2, "update": 4, "delete": 8}
+
+# Canonical verb strings; validated operations reuse these objects
+_CRUD_INTERNED = {verb: sys.intern(verb) for verb in _VERB_BIT}
+
+# Plain str at validation time (checked against _VERB_BIT by the validator),
+# still advertised to the LLM as an enum
+ALLOWED_CRUD_OPERATIONS = Annotated[
+    str, WithJsonSchema({"type": "string", "enum": list(_VERB_BIT)})
+]
+
 
 class EntityField(BaseModel):
     """Field definition for an entity.
@@ -20,6 +36,7 @@ class EntityField(BaseModel):
     - 'boolean': For true/false, yes/no values
     - 'string': For all other text fields
     """
+    model_config = ConfigDict(frozen=True)
     
     name: str = Field(
         description="The name of the field (e.g., 'title', 'description', 'status')"
@@ -49,7 +66,7 @@ class PrimaryEntity(BaseModel):
     name: str = Field(
         description="The name of the entity (e.g., 'Task', 'Bug', 'Note')"
     )
-    description: str = Field(
+    description: EntityDescription = Field(
         description=(
             "Natural language description of what this entity represents. "
             "Example: 'A task with a title and description' (min 10 characters)"
@@ -73,19 +90,6 @@ class PrimaryEntity(BaseModel):
         description="Field name to use as natural key (only if id_strategy is 'natural_key')"
     )
     
-    @field_validator('description')
-    @classmethod
-    def validate_description_length(cls, v: str) -> str:
-        """Ensure description is meaningful (not a short placeholder)."""
-        min_length = 10
-        if len(v.strip()) < min_length:
-            raise ValueError(
-                f"Entity description must be at least {min_length} characters. "
-                f"Received: '{v}' ({len(v.strip())} characters). "
-                f"Use descriptive text like 'A task with a title and description' instead."
-            )
-        return v
-    
     @field_validator('fields')
     @classmethod
     def validate_fields_not_empty(cls, v: List[EntityField]) -> List[EntityField]:
@@ -108,6 +112,7 @@ class UIExpectations(BaseModel):
     - 'wizard': Step-by-step guided flows
     - 'no_ui': Backend-only/API services with no UI
     """
+    model_config = ConfigDict(frozen=True)
     
     complexity: Optional[ALLOWED_UI_COMPLEXITY] = Field(
         default="basic",
@@ -124,13 +129,19 @@ class UIExpectations(BaseModel):
     )
 
 
+# Prototypes for IntentModel defaults. UIExpectations is frozen, so one
+# instance is shared; the assumptions tuple is copied into a fresh list.
+_UI_DEFAULT = UIExpectations.model_construct()
+DEFAULT_ASSUMPTIONS: Final[Tuple[str, ...]] = ("Single-user application", "Local execution")
+
+
 class EntityOperations(BaseModel):
     """Operations supported for a specific entity."""
     
     entity_name: str = Field(
         description="The name of the entity (must match a name in primary_entities)"
     )
-    operations: List[ALLOWED_CRUD_OPERATIONS] = Field(
+    operations: Tuple[ALLOWED_CRUD_OPERATIONS, ...] = Field(
         description=(
             "List of supported CRUD operations for this entity. "
             "Values are deduplicated CRUD verbs: ['create', 'read', 'update', 'delete']."
@@ -139,14 +150,26 @@ class EntityOperations(BaseModel):
     
     @field_validator('operations')
     @classmethod
-    def validate_no_duplicates(cls, v: List[ALLOWED_CRUD_OPERATIONS]) -> List[ALLOWED_CRUD_OPERATIONS]:
-        """Ensure operations list has no duplicates."""
-        if len(v) != len(set(v)):
-            raise ValueError(
-                f"Operations contain duplicates: {v}. "
-                f"Each verb should appear only once."
-            )
-        return v
+    def validate_no_duplicates(cls, v: Tuple[str, ...]) -> Tuple[str, ...]:
+        """Ensure operations are CRUD verbs with no duplicates.
+        
+        Returns the verbs as the interned module-level strings.
+        """
+        mask = 0
+        for verb in v:
+            bit = _VERB_BIT.get(verb, 0)
+            if not bit:
+                raise ValueError(
+                    f"Invalid operation '{verb}'. "
+                    f"Allowed operations are: {list(_VERB_BIT)}."
+                )
+            if mask & bit:
+                raise ValueError(
+                    f"Operations contain duplicates: {v}. "
+                    f"Each verb should appear only once."
+                )
+            mask |= bit
+        return tuple(_CRUD_INTERNED[verb] for verb in v)
 
 
 class IntentModel(BaseModel):
@@ -186,12 +209,12 @@ class IntentModel(BaseModel):
     )
     
     ui_expectations: UIExpectations = Field(
-        default_factory=lambda: UIExpectations(),
+        default_factory=lambda: _UI_DEFAULT,
         description="UI complexity and interaction expectations"
     )
     
     assumptions: List[str] = Field(
-        default_factory=lambda: ["Single-user application", "Local execution"],
+        default_factory=lambda: list(DEFAULT_ASSUMPTIONS),
         description=(
             "List of assumptions about the application context. "
             "The defaults 'Single-user application' and 'Local execution' are MANDATORY and automatically included. "
@@ -205,21 +228,30 @@ class IntentModel(BaseModel):
         description="List of explicitly excluded features or goals"
     )
     
+    @field_validator('assumptions')
+    @classmethod
+    def dedupe_assumptions(cls, v: List[str]) -> List[str]:
+        """Drop repeated assumptions (keeping first-seen order) and intern them.
+        
+        The same few assumption strings recur across every intent of a run.
+        """
+        return list(dict.fromkeys(map(sys.intern, v)))
+    
     @model_validator(mode='after')
     def validate_operations(self):
         """Validate operations are entity-centric and properly structured."""
         # Create a set of entity names from primary_entities
         entity_names = {entity.name for entity in self.primary_entities}
         
-        # Get entity names from operations
-        operations_entity_names = {op.entity_name for op in self.operations}
-        
         # Rule 1: All operations entity_names must be valid entity names
-        invalid_names = operations_entity_names - entity_names
+        # (the set of invalid names is only built on the error path)
+        invalid_names = [
+            op.entity_name for op in self.operations if op.entity_name not in entity_names
+        ]
         if invalid_names:
             raise ValueError(
                 f"Operations entity_names must reference valid entities only. "
-                f"Invalid entity names found: {invalid_names}. "
+                f"Invalid entity names found: {set(invalid_names)}. "
                 f"Valid entity names are: {entity_names}. "
                 f"Do not use action verbs like 'create_bug', 'list_bugs', 'create', 'edit', 'delete' as entity names."
             )
@@ -237,3 +269,8 @@ class IntentInterpreterResponse(BaseModel):
         description="Human-readable summary of changes made or initial intent"
     )
 
+
+# Bound validator entrypoint. The model is not deferred, so its validator is
+# already built at import; binding it skips the per-call attribute lookups in
+# the intent interpreter's hot path.
+INTENT_RESPONSE_VALIDATE = IntentInterpreterResponse.__pydantic_validator__.validate_python
@@ -1,25 +1,43 @@
-"""System and user prompts."""
-
-from .intent_interpreter_prompts import (
-    INTENT_INTERPRETER_CREATE_SYSTEM_PROMPT,
-    INTENT_INTERPRETER_MODIFY_SYSTEM_PROMPT,
-    INTENT_INTERPRETER_CREATE_PROMPT,
-    INTENT_INTERPRETER_MODIFY_PROMPT,
-)
-from .architect_prompts import (
-    ARCHITECT_INITIAL_SYSTEM_PROMPT,
-    ARCHITECT_ITERATIVE_SYSTEM_PROMPT,
-    ARCHITECT_INITIAL_PROMPT,
-    ARCHITECT_ITERATIVE_PROMPT,
-)
-from .spec_planner_prompts import (
-    SPEC_PLANNER_SYSTEM_PROMPT,
-    SPEC_PLANNER_PROMPT,
-)
-from .code_agents import (
-    BACKEND_MODEL_AGENT_SYSTEM_PROMPT,
-    BACKEND_MODEL_AGENT_PROMPT,
-)
+"""System and user prompts.
+
+Submodules are imported lazily (PEP 562) on first attribute access, so importing
+one prompt module does not load the others (or LangChain) with it.
+"""
+
+from importlib import import_module
+
+# Exported name -> submodule that defines it
+_LAZY = {
+    "INTENT_INTERPRETER_CREATE_SYSTEM_PROMPT": "intent_interpreter_prompts",
+    "INTENT_INTERPRETER_MODIFY_SYSTEM_PROMPT": "intent_interpreter_prompts",
+    "INTENT_INTERPRETER_CREATE_PROMPT": "intent_interpreter_prompts",
+    "INTENT_INTERPRETER_MODIFY_PROMPT": "intent_interpreter_prompts",
+    "ARCHITECT_INITIAL_SYSTEM_PROMPT": "architect_prompts",
+    "ARCHITECT_ITERATIVE_SYSTEM_PROMPT": "architect_prompts",
+    "ARCHITECT_INITIAL_PROMPT": "architect_prompts",
+    "ARCHITECT_ITERATIVE_PROMPT": "architect_prompts",
+    "ARCHITECT_REGISTRY_PROMPT": "architect_prompts",
+    "get_architect_prompts": "architect_prompts",
+    "SPEC_PLANNER_SYSTEM_PROMPT": "spec_planner_prompts",
+    "SPEC_PLANNER_PROMPT": "spec_planner_prompts",
+    "BACKEND_MODEL_AGENT_SYSTEM_PROMPT": "code_agents",
+    "BACKEND_MODEL_AGENT_PROMPT": "code_agents",
+}
+
+
+def __getattr__(name: str):
+    try:
+        module_name = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(import_module(f".{module_name}", __name__), name)
+    globals()[name] = value  # Cache so later lookups bypass __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(__all__)
+
 
 __all__ = [
     "INTENT_INTERPRETER_CREATE_SYSTEM_PROMPT",
@@ -30,9 +48,10 @@ __all__ = [
     "ARCHITECT_ITERATIVE_SYSTEM_PROMPT",
     "ARCHITECT_INITIAL_PROMPT",
     "ARCHITECT_ITERATIVE_PROMPT",
+    "ARCHITECT_REGISTRY_PROMPT",
+    "get_architect_prompts",
     "SPEC_PLANNER_SYSTEM_PROMPT",
     "SPEC_PLANNER_PROMPT",
     "BACKEND_MODEL_AGENT_SYSTEM_PROMPT",
     "BACKEND_MODEL_AGENT_PROMPT",
 ]
-
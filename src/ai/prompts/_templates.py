@@ -0,0 +1,35 @@
+"""Chat prompt template construction shared by the prompt modules."""
+
+from typing import TYPE_CHECKING, Sequence
+
+if TYPE_CHECKING:
+    from langchain_core.prompts import ChatPromptTemplate
+
+
+def chat_prompt(system: str, user: str, context: Sequence[str] = ()) -> "ChatPromptTemplate":
+    """Build a system + user ChatPromptTemplate.
+    
+    LangChain is imported here, on first use, so modules that only need the
+    prompt strings do not pay for importing it.
+    
+    Args:
+        system: System prompt template
+        user: User prompt template
+        context: Extra system message templates placed between the two. Put
+            inputs that vary by configuration here, so the main system prompt
+            stays a static (provider-cacheable) prefix.
+    
+    Returns:
+        Chat prompt template
+    """
+    from langchain_core.prompts import (
+        ChatPromptTemplate,
+        SystemMessagePromptTemplate,
+        HumanMessagePromptTemplate,
+    )
+    
+    return ChatPromptTemplate.from_messages([
+        SystemMessagePromptTemplate.from_template(system),
+        *map(SystemMessagePromptTemplate.from_template, context),
+        HumanMessagePromptTemplate.from_template(user),
+    ])
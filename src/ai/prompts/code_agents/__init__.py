@@ -1,25 +1,39 @@
-"""Code agent prompts."""
-
-from .backend_model_agent_prompts import (
-    BACKEND_MODEL_AGENT_SYSTEM_PROMPT,
-    BACKEND_MODEL_AGENT_PROMPT,
-)
-from .backend_service_agent_prompts import (
-    BACKEND_SERVICE_AGENT_SYSTEM_PROMPT,
-    BACKEND_SERVICE_AGENT_PROMPT,
-)
-from .database_agent_prompts import (
-    DATABASE_AGENT_SYSTEM_PROMPT,
-    DATABASE_AGENT_PROMPT,
-)
-from .backend_router_agent_prompts import (
-    BACKEND_ROUTER_AGENT_SYSTEM_PROMPT,
-    BACKEND_ROUTER_AGENT_PROMPT,
-)
-from .backend_app_agent_prompts import (
-    BACKEND_APP_AGENT_SYSTEM_PROMPT,
-    BACKEND_APP_AGENT_PROMPT,
-)
+"""Code agent prompts.
+
+Submodules are imported lazily (PEP 562) on first attribute access, so importing
+one prompt module does not load the others (or LangChain) with it.
+"""
+
+from importlib import import_module
+
+# Exported name -> submodule that defines it
+_LAZY = {
+    "BACKEND_MODEL_AGENT_SYSTEM_PROMPT": "backend_model_agent_prompts",
+    "BACKEND_MODEL_AGENT_PROMPT": "backend_model_agent_prompts",
+    "BACKEND_SERVICE_AGENT_SYSTEM_PROMPT": "backend_service_agent_prompts",
+    "BACKEND_SERVICE_AGENT_PROMPT": "backend_service_agent_prompts",
+    "DATABASE_AGENT_SYSTEM_PROMPT": "database_agent_prompts",
+    "DATABASE_AGENT_PROMPT": "database_agent_prompts",
+    "BACKEND_ROUTER_AGENT_SYSTEM_PROMPT": "backend_router_agent_prompts",
+    "BACKEND_ROUTER_AGENT_PROMPT": "backend_router_agent_prompts",
+    "BACKEND_APP_AGENT_SYSTEM_PROMPT": "backend_app_agent_prompts",
+    "BACKEND_APP_AGENT_PROMPT": "backend_app_agent_prompts",
+}
+
+
+def __getattr__(name: str):
+    try:
+        module_name = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(import_module(f".{module_name}", __name__), name)
+    globals()[name] = value  # Cache so later lookups bypass __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(__all__)
+
 
 __all__ = [
     "BACKEND_MODEL_AGENT_SYSTEM_PROMPT",
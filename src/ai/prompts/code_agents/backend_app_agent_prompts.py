@@ -1,25 +1,18 @@
 """Prompts for Backend App Agent."""
 
-from langchain_core.prompts import (
-    ChatPromptTemplate,
-    SystemMessagePromptTemplate,
-    HumanMessagePromptTemplate,
-)
-
-
-BACKEND_APP_AGENT_SYSTEM_PROMPT = """You are the Backend App Agent. Create the FastAPI application entrypoint (main.py) that bootstraps the backend.
-
-## ARCHITECTURE FLOW
-Backend Model Agent → Database Agent → Backend Service Agent → Backend Router Agent → **YOU (App Bootstrap)**
+from functools import lru_cache
+from typing import TYPE_CHECKING
 
-All routers have been created. Your job is to create main.py that imports and registers all routers.
+from .._templates import chat_prompt
 
-## TASK
-Generate main.py based on backend_app_spec. Follow the spec exactly - do not add, remove, or assume anything beyond what is specified.
+if TYPE_CHECKING:
+    from langchain_core.prompts import ChatPromptTemplate
 
-## CODE STRUCTURE
 
-```python
+# Few-shot main.py example (braces escaped for ChatPromptTemplate). Spliced into
+# the static system prompt rather than sent as a separate message, so it stays
+# inside the cacheable prompt prefix.
+_CODE_STRUCTURE_EXAMPLE = """```python
 from fastapi import FastAPI
 from backend.routes.task_routes import router as task_router
 
@@ -43,7 +36,21 @@ if __name__ == "__main__":
     import uvicorn
     uvicorn.run(app, host="0.0.0.0", port=1234)
 ```
+"""
+
+BACKEND_APP_AGENT_SYSTEM_PROMPT = """You are the Backend App Agent. Create the FastAPI application entrypoint (main.py) that bootstraps the backend.
 
+## ARCHITECTURE FLOW
+Backend Model Agent → Database Agent → Backend Service Agent → Backend Router Agent → **YOU (App Bootstrap)**
+
+All routers have been created. Your job is to create main.py that imports and registers all routers.
+
+## TASK
+Generate main.py based on backend_app_spec. Follow the spec exactly - do not add, remove, or assume anything beyond what is specified.
+
+## CODE STRUCTURE
+
+""" + _CODE_STRUCTURE_EXAMPLE + """
 ## REQUIREMENTS
 
 **File Structure:**
@@ -141,10 +148,7 @@ Must include:
 - Configuration concerns"""
 
 
-BACKEND_APP_AGENT_PROMPT = ChatPromptTemplate.from_messages([
-    SystemMessagePromptTemplate.from_template(BACKEND_APP_AGENT_SYSTEM_PROMPT),
-    HumanMessagePromptTemplate.from_template(
-        """Backend App Specification:
+BACKEND_APP_AGENT_USER_PROMPT = """Backend App Specification:
 {backend_app_spec}
 
 Entity Information:
@@ -172,5 +176,18 @@ Generate the FastAPI main.py file that registers all routers.
    - routers_registered (int)
    - total_lines (int)
    - middleware_configured (List[str]) - list only middleware that was actually configured (empty if none)"""
-    ),
-])
+
+
+@lru_cache(maxsize=None)
+def _template() -> "ChatPromptTemplate":
+    """Build the chat prompt template once."""
+    return chat_prompt(BACKEND_APP_AGENT_SYSTEM_PROMPT, BACKEND_APP_AGENT_USER_PROMPT)
+
+
+def __getattr__(name: str):
+    """Build BACKEND_APP_AGENT_PROMPT (and import LangChain) on first access."""
+    if name != "BACKEND_APP_AGENT_PROMPT":
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = _template()
+    globals()[name] = value  # Cache so later lookups bypass __getattr__
+    return value
@@ -0,0 +1,39 @@
+"""In-process memoization helpers."""
+
+from collections import OrderedDict
+from functools import wraps
+from typing import Any, Callable, Hashable
+
+
+def lru_cache_by(key: Callable[..., Hashable], maxsize: int = 128) -> Callable:
+    """Like `functools.lru_cache`, but keyed by `key(*args, **kwargs)`.
+
+    For functions whose arguments are unhashable (dicts, lists) but have a cheap
+    stable key, such as a `content_hash`. Calls that raise are not cached.
+
+    Args:
+        key: Builds the cache key from the call's arguments
+        maxsize: Number of most recent results to keep
+
+    Returns:
+        Decorator; the wrapped function gains a `cache_clear()` method
+    """
+    def decorator(func: Callable) -> Callable:
+        cache: "OrderedDict[Hashable, Any]" = OrderedDict()
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            cache_key = key(*args, **kwargs)
+            if cache_key in cache:
+                cache.move_to_end(cache_key)
+                return cache[cache_key]
+            result = func(*args, **kwargs)
+            cache[cache_key] = result
+            if len(cache) > maxsize:
+                cache.popitem(last=False)
+            return result
+
+        wrapper.cache_clear = cache.clear
+        return wrapper
+
+    return decorator
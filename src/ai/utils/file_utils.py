@@ -0,0 +1,58 @@
+"""File writing helpers shared by the graph nodes and agents."""
+
+import os
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+from .json_utils import dumps_bytes, dumps_pretty
+
+
+def write_file(path: Path, data: bytes, mode: int = 0o644) -> None:
+    """Create or truncate a file and write data to it, setting its mode at creation.
+
+    The parent directory is only created when the first open fails, so the
+    common case (directory already exists) costs no extra stat/mkdir calls.
+    """
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC
+    try:
+        fd = os.open(path, flags, mode)
+    except FileNotFoundError:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd = os.open(path, flags, mode)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+
+def save_spec_json(
+    root_dir: Optional[Path],
+    filename: str,
+    obj: Any,
+    default: Optional[Callable[[Any], Any]] = None,
+) -> None:
+    """Save a spec object as JSON to <root_dir>/spec/<filename>.
+
+    Files are compact by default and indented when APPBUILDER_PRETTY_JSON=1.
+    Empty objects are not saved.
+
+    Args:
+        root_dir: Root directory of the generated app
+        filename: File name inside the spec directory
+        obj: JSON-serializable object
+        default: Optional fallback for types JSON cannot represent (e.g. `str`)
+
+    Raises:
+        ValueError: If root_dir is missing
+    """
+    if not obj:
+        # Nothing to save
+        return
+
+    if not root_dir:
+        raise ValueError(f"root_dir is required in state to save {filename}")
+
+    dumps = dumps_pretty if os.getenv("APPBUILDER_PRETTY_JSON") == "1" else dumps_bytes
+    write_file(root_dir / "spec" / filename, dumps(obj, default=default))
@@ -0,0 +1,141 @@
+"""JSON serialization helpers.
+
+Uses orjson when it is available (it ships with langgraph/langsmith) and falls
+back to the standard library otherwise.
+"""
+
+import hashlib
+import json
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Callable, Optional, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is an optional speedup
+    orjson = None
+
+
+def dumps_compact(obj: Any) -> str:
+    """Serialize an object to compact JSON (no indentation or extra whitespace).
+
+    Intended for prompt inputs, where pretty-printing only adds tokens.
+
+    Args:
+        obj: JSON-serializable object
+
+    Returns:
+        Compact JSON string
+    """
+    if orjson is not None:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False)
+
+
+def dumps_bytes(obj: Any, default: Optional[Callable[[Any], Any]] = None) -> bytes:
+    """Serialize an object to compact UTF-8 JSON bytes.
+
+    Intended for JSON files written to disk that nobody needs to read by hand.
+
+    Args:
+        obj: JSON-serializable object
+        default: Optional fallback for types JSON cannot represent (e.g. `str`)
+
+    Returns:
+        Compact JSON as bytes
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, default=default)
+    return json.dumps(obj, separators=(",", ":"), default=default, ensure_ascii=False).encode()
+
+
+def dumps_pretty(obj: Any, default: Optional[Callable[[Any], Any]] = None) -> bytes:
+    """Serialize an object to indented (2-space) UTF-8 JSON bytes.
+
+    Intended for JSON files written to disk.
+
+    Args:
+        obj: JSON-serializable object
+        default: Optional fallback for types JSON cannot represent (e.g. `str`)
+
+    Returns:
+        Indented JSON as bytes
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, default=default, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2, default=default, ensure_ascii=False).encode()
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """Parse JSON from bytes or str.
+
+    Args:
+        data: JSON document
+
+    Returns:
+        Parsed object
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def clone(obj: Any) -> Any:
+    """Deep-copy JSON data with a serialize/parse round trip.
+
+    Much faster than `copy.deepcopy` for plain dict/list trees. Only use it on
+    JSON-native data (no Path, set, tuple, ...).
+
+    Args:
+        obj: JSON-native object (or None)
+
+    Returns:
+        Independent copy of obj
+    """
+    if obj is None:
+        return None
+    if orjson is not None:
+        return orjson.loads(orjson.dumps(obj))
+    return json.loads(json.dumps(obj))
+
+
+@lru_cache(maxsize=32)
+def _load_file(path: str, mtime_ns: int) -> Any:
+    """Parse a JSON file. Cached per (path, mtime) so edits invalidate it."""
+    with open(path, "rb") as f:
+        return loads(f.read())
+
+
+def load_cached(path: Path) -> Any:
+    """Load a JSON file, reusing the parsed result while the file is unchanged.
+
+    The returned object is shared between calls and must be treated as read-only.
+
+    Args:
+        path: Path to the JSON file
+
+    Returns:
+        Parsed object
+
+    Raises:
+        FileNotFoundError: If the file does not exist
+    """
+    return _load_file(str(path), path.stat().st_mtime_ns)
+
+
+def content_hash(obj: Any) -> bytes:
+    """Hash the canonical (key-sorted, compact) JSON form of an object.
+
+    Equal JSON content gives equal digests regardless of dict key order.
+
+    Args:
+        obj: JSON-serializable object
+
+    Returns:
+        16-byte BLAKE2b digest
+    """
+    if orjson is not None:
+        data = orjson.dumps(obj, option=orjson.OPT_SORT_KEYS)
+    else:
+        data = json.dumps(obj, sort_keys=True, separators=(",", ":"), ensure_ascii=False).encode()
+    return hashlib.blake2b(data, digest_size=16).digest()
@@ -2,7 +2,7 @@ from langchain_openai import ChatOpenAI
 from langchain_ollama import ChatOllama
 from langchain_core.language_models.chat_models import BaseChatModel
 
-from typing import Literal
+from typing import Literal, Optional
 
 from dotenv import load_dotenv
 import os
@@ -10,15 +10,53 @@ import os
 load_dotenv()
 
 OLLAMA_BASE_URL = os.getenv("OLLAMA_BASE_URL")
+OPENAI_BASE_URL = os.getenv("OPENAI_BASE_URL")
+
+# Prompt-lookup (n-gram) speculative decoding hints understood by OpenAI-compatible
+# servers such as vLLM. Servers that do not know these params may reject the
+# request, so they are only forwarded when OPENAI_BASE_URL points at a
+# self-hosted server AND APPBUILDER_SPECULATIVE_HINTS=1 opts in.
+SPECULATIVE_HINTS_ENABLED = os.getenv("APPBUILDER_SPECULATIVE_HINTS") == "1"
+SPECULATIVE_DECODING_HINTS = {
+    "prompt_lookup_num_tokens": 10,
+}
+
 
 def init_llm(
     provider: Literal["openai", "ollama"],
     model: str,
     additional_kwargs: dict = {},
+    decoding_hints: Optional[dict] = None,
+    prompt_cache_key: Optional[str] = None,
 ):
+    """Create a chat model for a provider.
+
+    Args:
+        provider: The provider to use
+        model: The model to use
+        additional_kwargs: Additional kwargs to pass to the LLM
+        decoding_hints: Speculative decoding hints for self-hosted OpenAI-compatible
+            servers; ignored unless APPBUILDER_SPECULATIVE_HINTS=1
+        prompt_cache_key: Routing key for the hosted OpenAI API's automatic prompt
+            caching. Calls sharing a key and a static prompt prefix (system
+            prompt first, dynamic input last) are more likely to hit the cache.
+    """
+    additional_kwargs = dict(additional_kwargs)
+    if decoding_hints and SPECULATIVE_HINTS_ENABLED and provider == "openai" and OPENAI_BASE_URL:
+        additional_kwargs["extra_body"] = {
+            **decoding_hints,
+            **additional_kwargs.get("extra_body", {}),
+        }
+    if prompt_cache_key and provider == "openai" and not OPENAI_BASE_URL:
+        additional_kwargs["extra_body"] = {
+            "prompt_cache_key": prompt_cache_key,
+            **additional_kwargs.get("extra_body", {}),
+        }
+
     if provider == "openai":
         return ChatOpenAI(model=model, **additional_kwargs)
     elif provider == "ollama":
         return ChatOllama(model=model, base_url=OLLAMA_BASE_URL, **additional_kwargs)
     else:
-        raise ValueError(f"Invalid provider: {provider}")
\ No newline at end of file
+        raise ValueError(f"Invalid provider: {provider}")
+
@@ -0,0 +1,96 @@
+"""Tests for ArchitectResponse execution layer validation."""
+
+import re
+
+import pytest
+from pydantic import ValidationError
+
+from src.ai.models.architect_models import ArchitectResponse
+
+
+def _layer(layer_id, depends_on=()):
+    return {
+        "id": layer_id,
+        "generator": f"{layer_id}_agent",
+        "path": layer_id.replace("_", "/"),
+        "depends_on": list(depends_on),
+    }
+
+
+def _response(layers):
+    return ArchitectResponse.model_validate({
+        "tech_stack": {"backend": "fastapi", "frontend": "streamlit"},
+        "execution_layers": layers,
+    })
+
+
+def _assert_rejected(layers, message):
+    with pytest.raises(ValidationError, match=re.escape(message)):
+        _response(layers)
+
+
+def test_valid_dag_is_accepted():
+    response = _response([
+        _layer("backend_models"),
+        _layer("database", ["backend_models"]),
+        _layer("backend_services", ["database", "backend_models", "database"]),
+        _layer("backend_routes", ["backend_services"]),
+        _layer("frontend_ui", ["backend_routes"]),
+    ])
+
+    assert [layer.id for layer in response.execution_layers] == [
+        "backend_models", "database", "backend_services", "backend_routes", "frontend_ui",
+    ]
+    services = response.execution_layers[2]
+    assert services.depends_on == frozenset({"backend_models", "database"})
+    # Dependencies dump as a sorted, deduplicated list
+    assert response.model_dump()["execution_layers"][2]["depends_on"] == ["backend_models", "database"]
+
+
+def test_empty_layers_are_rejected():
+    _assert_rejected([], "At least one execution layer is required")
+
+
+def test_duplicate_ids_are_rejected():
+    _assert_rejected(
+        [_layer("backend_models"), _layer("database"), _layer("backend_models")],
+        "Duplicate layer IDs found: {'backend_models'}. Each layer must have a unique ID.",
+    )
+
+
+def test_unknown_dependencies_are_rejected():
+    _assert_rejected(
+        [_layer("backend_models"), _layer("database", ["backend_models", "zeta", "alpha"])],
+        "Layer 'database' has invalid dependencies: ['alpha', 'zeta']. "
+        "All dependencies must reference existing layer IDs.",
+    )
+
+
+def test_self_dependency_is_rejected():
+    _assert_rejected(
+        [_layer("backend_models"), _layer("database", ["backend_models", "database"])],
+        "Layer 'database' cannot depend on itself",
+    )
+
+
+def test_direct_cycle_is_rejected():
+    _assert_rejected(
+        [_layer("backend_models"), _layer("database", ["backend_services"]), _layer("backend_services", ["database"])],
+        "Circular dependencies found between layers: ['backend_services', 'database']. "
+        "Layer dependencies must form a directed acyclic graph.",
+    )
+
+
+def test_transitive_cycle_reports_the_layers_it_blocks():
+    _assert_rejected(
+        [
+            _layer("backend_models"),
+            _layer("database", ["backend_models", "backend_routes"]),
+            _layer("backend_services", ["database"]),
+            _layer("backend_routes", ["backend_services"]),
+            _layer("frontend_ui", ["backend_routes"]),
+        ],
+        "Circular dependencies found between layers: "
+        "['backend_routes', 'backend_services', 'database', 'frontend_ui']. "
+        "Layer dependencies must form a directed acyclic graph.",
+    )
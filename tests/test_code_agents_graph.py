@@ -0,0 +1,120 @@
+"""Tests for the code agents graph scheduler (initialize_execution_queue + global_router)."""
+
+import pytest
+from langgraph.graph import END
+
+from src.ai.graphs.code_agents_graph import global_router, initialize_execution_queue
+
+
+def _layer(layer_id, path, depends_on=()):
+    return {"id": layer_id, "path": path, "depends_on": list(depends_on)}
+
+
+FULL_STACK_LAYERS = [
+    _layer("backend_models", "backend/models"),
+    _layer("database", "backend/database", ["backend_models"]),
+    _layer("backend_services", "backend/services", ["backend_models", "database"]),
+    _layer("backend_routes", "backend/routes", ["backend_services"]),
+    _layer("backend_app", "backend/main.py", ["backend_routes"]),
+    _layer("frontend_ui", "frontend", ["backend_routes"]),
+]
+
+
+def _init_state(layers, affected_layers=None):
+    """Build router state from an architecture, as the graph does after initialization."""
+    state = {
+        "architecture": {"execution_layers": layers},
+        "affected_layers": affected_layers,
+        "completed_layers": [],
+    }
+    state.update(initialize_execution_queue(state))
+    return state
+
+
+def _dispatched(sends):
+    """(node, layer_id) pairs for the Sends returned by global_router."""
+    return sorted((send.node, send.arg["current_layer"][0]) for send in sends)
+
+
+def test_ready_layers_are_dispatched_together():
+    state = _init_state([
+        _layer("backend_models", "backend/models"),
+        _layer("frontend_ui", "frontend"),
+        _layer("database", "backend/database", ["backend_models"]),
+    ])
+
+    assert _dispatched(global_router(state)) == [
+        ("backend_model_agent", "backend_models"),
+        ("frontend_agent", "frontend_ui"),
+    ]
+
+    state["completed_layers"] = ["backend_models", "frontend_ui"]
+    assert _dispatched(global_router(state)) == [("database_agent", "database")]
+
+
+def test_layer_waits_for_all_of_its_dependencies():
+    state = _init_state(FULL_STACK_LAYERS)
+
+    state["completed_layers"] = ["backend_models"]
+    assert _dispatched(global_router(state)) == [("database_agent", "database")]
+
+    state["completed_layers"] = ["backend_models", "database", "backend_services", "backend_routes"]
+    assert _dispatched(global_router(state)) == [
+        ("backend_app_agent", "backend_app"),
+        ("frontend_agent", "frontend_ui"),
+    ]
+
+
+def test_send_carries_the_layer_path():
+    state = _init_state([_layer("backend_app", "backend/main.py")])
+
+    (send,) = global_router(state)
+    assert send.arg["current_layer"] == ("backend_app", "backend/main.py")
+
+
+def test_dependencies_outside_the_queue_are_ignored():
+    state = _init_state(FULL_STACK_LAYERS, affected_layers=["frontend_ui", "backend_app"])
+
+    assert state["execution_queue"] == [
+        ("backend_app", "backend/main.py"),
+        ("frontend_ui", "frontend"),
+    ]
+    assert state["layer_dependencies"] == {"backend_app": [], "frontend_ui": []}
+    assert _dispatched(global_router(state)) == [
+        ("backend_app_agent", "backend_app"),
+        ("frontend_agent", "frontend_ui"),
+    ]
+
+
+def test_layers_without_an_agent_are_not_queued():
+    state = _init_state([
+        _layer("backend_models", "backend/models"),
+        _layer("docs", "docs", ["backend_models"]),
+    ])
+
+    assert state["execution_queue"] == [("backend_models", "backend/models")]
+
+
+def test_router_ends_once_every_queued_layer_is_complete():
+    state = _init_state(FULL_STACK_LAYERS)
+    state["completed_layers"] = [layer["id"] for layer in FULL_STACK_LAYERS]
+
+    assert global_router(state) == END
+
+
+def test_router_ends_when_nothing_is_queued():
+    state = _init_state(FULL_STACK_LAYERS, affected_layers=[])
+
+    assert global_router(state) == END
+
+
+def test_cycle_raises():
+    state = _init_state([
+        _layer("backend_models", "backend/models"),
+        _layer("database", "backend/database", ["backend_services"]),
+        _layer("backend_services", "backend/services", ["database"]),
+    ])
+    state["completed_layers"] = ["backend_models"]
+
+    with pytest.raises(ValueError, match=r"circular dependencies among: \['database', 'backend_services'\]"):
+        global_router(state)